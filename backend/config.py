@@ -89,6 +89,7 @@ def _resolve_model_path(env_var_name, default_name, search_parent=True):
 STT_MODEL_PATH = _resolve_model_path('SHERPA_PATH', 'sherpa-onnx-nemo-parakeet-tdt-0.6b-v3-int8')
 TTS_MODEL_PATH = _resolve_model_path('KOKORO_PATH', 'kokoro-en-v0_19')
 VAD_MODEL_PATH = MODELS_DIR / "silero_vad.onnx"
+VAD_INT8_MODEL_PATH = MODELS_DIR / "silero_vad.int8.onnx"  # Optional, used only on VNNI CPUs
 INTENT_CLASSIFIER_PATH = MODELS_DIR / "intent_model" / "setfit_intent_classifier"
 
 # Asset paths
@@ -5,45 +5,94 @@ Stores interactions in SQLite database for future training.
 """
 import sqlite3
 import json
+import sys
 import time
 from collections import deque
+from dataclasses import dataclass
+from itertools import chain, islice
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import logging
+import threading
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# One numbered User/AXIOM pair of the LLM context block (bound once, not rebuilt per turn)
+_format_context_entry = "{0}. User: {1.user_query}\n   AXIOM: {1.response}".format
+
+# Shared by the single and batched writers: one SQL string, so the connection's
+# statement cache compiles it once
+_INSERT_SQL = """
+    INSERT INTO interactions 
+    (session_id, timestamp, user_query, intent, confidence, response, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Connection tuning for file-backed databases (not applicable to ':memory:')
+FILE_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Interaction:
+    """
+    One turn held in the active history.
+    Slotted: no per-entry __dict__ or key storage, unlike the dict it replaces.
+    """
+    timestamp: str
+    user_query: str
+    intent: str
+    response: str
+    confidence: float = 0.0
+    metadata: Optional[Dict] = None  # None rather than a fresh {} per turn
+
 
 class ConversationHistory:
     """
     Manages conversation context using a FIFO queue of recent interactions.
     Supports 4-5 interaction window for contextual responses.
+    
+    Optionally the first ``pin_first_k`` interactions of a session are pinned
+    ("attention sinks") and never evicted; the FIFO then covers the remaining
+    ``max_history - pin_first_k`` slots, so the memory budget is unchanged.
     """
     
-    def __init__(self, max_history: int = 5):
+    def __init__(self, max_history: int = 5, pin_first_k: int = 0):
         """
         Args:
             max_history: Maximum number of interactions to keep in active memory (default: 5)
+            pin_first_k: Leading interactions kept for the whole session (default: 0, plain FIFO)
         """
+        # At least one FIFO slot must remain so the newest turn is always kept
+        if pin_first_k < 0 or pin_first_k >= max(max_history, 1):
+            raise ValueError(f"pin_first_k must be in [0, max_history) = [0, {max_history}), got {pin_first_k}")
         self.max_history = max_history
-        self.history = deque(maxlen=max_history)  # FIFO queue
+        self.pin_first_k = pin_first_k
+        self.sinks: List[Interaction] = []  # Pinned session opening
+        self.history = deque(maxlen=max_history - pin_first_k)  # FIFO queue
         self.session_id = self._generate_session_id()
         
     def __len__(self):
         """Support len() operator"""
-        return len(self.history)
+        return len(self.sinks) + len(self.history)
     
     def __iter__(self):
-        """Support iteration"""
-        return iter(self.history)
+        """Support iteration (pinned interactions first, then the FIFO window)"""
+        return chain(self.sinks, self.history)
         
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
         return f"session_{int(time.time())}"
     
     def add_interaction(self, user_query: str, intent: str, response: str, 
-                       confidence: float = 0.0, metadata: Optional[Dict] = None):
+                       confidence: float = 0.0, metadata: Optional[Dict] = None,
+                       timestamp: Optional[str] = None):
         """
         Add a new interaction to the history (FIFO).
         
@@ -53,32 +102,47 @@ class ConversationHistory:
             response: AXIOM's response
             confidence: Intent classification confidence
             metadata: Additional context (RAG results, card triggers, etc.)
+            timestamp: ISO timestamp to record (default: now)
         """
-        interaction = {
-            "timestamp": datetime.now().isoformat(),
-            "user_query": user_query,
-            "intent": intent,
-            "response": response,
-            "confidence": confidence,
-            "metadata": metadata or {}
-        }
+        interaction = Interaction(
+            timestamp=timestamp or datetime.now().isoformat(),
+            user_query=user_query,
+            intent=sys.intern(intent),  # Small fixed label set: share one str per intent
+            response=response,
+            confidence=confidence,
+            metadata=metadata
+        )
         
-        self.history.append(interaction)
-        logger.debug(f"[HISTORY] Added interaction. Total: {len(self.history)}")
+        if len(self.sinks) < self.pin_first_k:
+            self.sinks.append(interaction)
+        else:
+            self.history.append(interaction)
+        logger.debug(f"[HISTORY] Added interaction. Total: {len(self)}")
     
-    def get_recent_interactions(self, count: Optional[int] = None) -> List[Dict]:
+    def _last(self) -> Optional[Interaction]:
+        """Most recent interaction, pinned or not"""
+        if self.history:
+            return self.history[-1]
+        return self.sinks[-1] if self.sinks else None
+    
+    def get_recent_interactions(self, count: Optional[int] = None) -> List[Interaction]:
         """
-        Get recent interactions from history.
+        Get recent interactions from history. Pinned interactions always come
+        first; the rest of ``count`` is filled from the newest FIFO entries.
         
         Args:
             count: Number of recent interactions to retrieve (default: all)
         
         Returns:
-            List of interaction dictionaries
+            List of Interaction entries
         """
         if count is None:
-            return list(self.history)
-        return list(self.history)[-count:]
+            return list(self)
+        sinks = self.sinks[:count]
+        window_count = count - len(sinks)
+        # Slice the deque in place instead of copying all of it first
+        # (also makes count=0 return nothing rather than everything)
+        return sinks + list(islice(self.history, max(len(self.history) - window_count, 0), None))
     
     def get_context_string(self, count: int = 3) -> str:
         """
@@ -90,29 +154,22 @@ class ConversationHistory:
         Returns:
             Formatted conversation context
         """
-        if not self.history:
+        if not self:
             return ""
         
         recent = self.get_recent_interactions(count)
-        context_lines = ["RECENT CONVERSATION CONTEXT:"]
-        
-        for i, interaction in enumerate(recent, 1):
-            context_lines.append(f"{i}. User: {interaction['user_query']}")
-            context_lines.append(f"   AXIOM: {interaction['response']}")
-        
-        return "\n".join(context_lines)
+        entries = map(_format_context_entry, range(1, len(recent) + 1), recent)
+        return "\n".join(["RECENT CONVERSATION CONTEXT:", *entries])
     
     def get_last_topic(self) -> Optional[str]:
         """Get the topic/intent of the last interaction"""
-        if not self.history:
-            return None
-        return self.history[-1]["intent"]
+        last = self._last()
+        return last.intent if last else None
     
     def get_last_query(self) -> Optional[str]:
         """Get the last user query"""
-        if not self.history:
-            return None
-        return self.history[-1]["user_query"]
+        last = self._last()
+        return last.user_query if last else None
     
     def has_related_context(self, keywords: List[str]) -> bool:
         """
@@ -125,14 +182,14 @@ class ConversationHistory:
         Returns:
             True if any keyword found in recent history
         """
-        if not self.history:
+        if not self:
             return False
         
         # Check last 3 interactions
         recent = self.get_recent_interactions(3)
         for interaction in recent:
-            query_lower = interaction["user_query"].lower()
-            response_lower = interaction["response"].lower()
+            query_lower = interaction.user_query.lower()
+            response_lower = interaction.response.lower()
             
             for keyword in keywords:
                 if keyword.lower() in query_lower or keyword.lower() in response_lower:
@@ -142,6 +199,7 @@ class ConversationHistory:
     
     def clear(self):
         """Clear conversation history (new session)"""
+        self.sinks.clear()
         self.history.clear()
         self.session_id = self._generate_session_id()
         logger.info("[HISTORY] Cleared conversation history - new session")
@@ -161,61 +219,67 @@ class InteractionDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        in_memory = db_path == ":memory:"
+        if not in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One connection for the object's lifetime: a ':memory:' database only
+        # lives as long as its connection, and reconnecting per call cost an
+        # open + schema read each time. The agent calls in from worker threads,
+        # so access is serialized with a lock instead of per-thread connections.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        if not in_memory:
+            # WAL: commits append to the log instead of fsyncing a rollback journal
+            for pragma in FILE_DB_PRAGMAS:
+                self._conn.execute(pragma)
         self._init_database()
     
+    @contextmanager
+    def _transaction(self):
+        """Cursor on the shared connection; commits on success, rolls back on error"""
+        with self._lock, self._conn:
+            yield self._conn.cursor()
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+    
     def _init_database(self):
         """Create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Main interactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                user_query TEXT NOT NULL,
-                intent TEXT NOT NULL,
-                confidence REAL,
-                response TEXT NOT NULL,
-                metadata TEXT,
-                feedback_rating INTEGER,
-                notes TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Session metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                interaction_count INTEGER DEFAULT 0,
-                avg_confidence REAL,
-                notes TEXT
-            )
-        """)
-        
-        # Create indexes for faster queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_intent 
-            ON interactions(intent)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp 
-            ON interactions(timestamp)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_session 
-            ON interactions(session_id)
-        """)
-        
-        conn.commit()
-        conn.close()
+        # Whole schema in a single executescript call
+        with self._lock:
+            self._conn.executescript("""
+                -- Main interactions table
+                CREATE TABLE IF NOT EXISTS interactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    user_query TEXT NOT NULL,
+                    intent TEXT NOT NULL,
+                    confidence REAL,
+                    response TEXT NOT NULL,
+                    metadata TEXT,
+                    feedback_rating INTEGER,
+                    notes TEXT,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                );
+                
+                -- Session metadata table
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT,
+                    interaction_count INTEGER DEFAULT 0,
+                    avg_confidence REAL,
+                    notes TEXT
+                );
+                
+                -- Indexes for faster queries
+                CREATE INDEX IF NOT EXISTS idx_intent ON interactions(intent);
+                CREATE INDEX IF NOT EXISTS idx_timestamp ON interactions(timestamp);
+                CREATE INDEX IF NOT EXISTS idx_session ON interactions(session_id);
+            """)
         logger.info(f"[DB] Initialized interaction database at {self.db_path}")
     
     def save_interaction(self, session_id: str, user_query: str, intent: str, 
@@ -232,48 +296,54 @@ class InteractionDatabase:
             confidence: Classification confidence
             metadata: Additional context data
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         timestamp = datetime.now().isoformat()
         metadata_json = json.dumps(metadata) if metadata else "{}"
         
-        cursor.execute("""
-            INSERT INTO interactions 
-            (session_id, timestamp, user_query, intent, confidence, response, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (session_id, timestamp, user_query, intent, confidence, response, metadata_json))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute(_INSERT_SQL, (session_id, timestamp, user_query, intent, confidence, response, metadata_json))
         logger.debug(f"[DB] Saved interaction: {intent} (confidence: {confidence:.2f})")
     
+    def save_interactions(self, session_id: str, interactions: List[Tuple[str, str, str, float]],
+                          timestamp: Optional[str] = None):
+        """
+        Save a batch of interactions in a single transaction.
+        
+        Args:
+            session_id: Current session ID
+            interactions: (user_query, intent, response, confidence) tuples
+            timestamp: ISO timestamp shared by the whole batch (default: now)
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        rows = [
+            (session_id, timestamp, user_query, intent, confidence, response, "{}")
+            for user_query, intent, response, confidence in interactions
+        ]
+        
+        with self._transaction() as cursor:  # One BEGIN/COMMIT for the whole batch
+            cursor.executemany(_INSERT_SQL, rows)
+        logger.debug(f"[DB] Saved {len(rows)} interactions")
+    
     def update_session(self, session_id: str, end_time: Optional[str] = None):
         """Update session statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get session stats
-        cursor.execute("""
-            SELECT COUNT(*), AVG(confidence)
-            FROM interactions
-            WHERE session_id = ?
-        """, (session_id,))
-        
-        count, avg_conf = cursor.fetchone()
-        
-        # Update or insert session
-        cursor.execute("""
-            INSERT OR REPLACE INTO sessions 
-            (session_id, start_time, end_time, interaction_count, avg_confidence)
-            VALUES (?, 
-                    COALESCE((SELECT start_time FROM sessions WHERE session_id = ?), ?),
-                    ?, ?, ?)
-        """, (session_id, session_id, datetime.now().isoformat(), 
-              end_time, count, avg_conf or 0.0))
-        
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            # Get session stats
+            cursor.execute("""
+                SELECT COUNT(*), AVG(confidence)
+                FROM interactions
+                WHERE session_id = ?
+            """, (session_id,))
+            
+            count, avg_conf = cursor.fetchone()
+            
+            # Update or insert session
+            cursor.execute("""
+                INSERT OR REPLACE INTO sessions 
+                (session_id, start_time, end_time, interaction_count, avg_confidence)
+                VALUES (?, 
+                        COALESCE((SELECT start_time FROM sessions WHERE session_id = ?), ?),
+                        ?, ?, ?)
+            """, (session_id, session_id, datetime.now().isoformat(), 
+                  end_time, count, avg_conf or 0.0))
     
     def get_training_data(self, intent: Optional[str] = None, 
                          min_confidence: float = 0.7,
@@ -289,61 +359,54 @@ class InteractionDatabase:
         Returns:
             List of (query, intent) tuples
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if intent:
-            query = """
-                SELECT user_query, intent
-                FROM interactions
-                WHERE intent = ? AND confidence >= ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            cursor.execute(query, (intent, min_confidence, limit))
-        else:
-            query = """
-                SELECT user_query, intent
-                FROM interactions
-                WHERE confidence >= ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            cursor.execute(query, (min_confidence, limit))
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self._transaction() as cursor:
+            if intent:
+                query = """
+                    SELECT user_query, intent
+                    FROM interactions
+                    WHERE intent = ? AND confidence >= ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """
+                cursor.execute(query, (intent, min_confidence, limit))
+            else:
+                query = """
+                    SELECT user_query, intent
+                    FROM interactions
+                    WHERE confidence >= ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """
+                cursor.execute(query, (min_confidence, limit))
+            
+            results = cursor.fetchall()
         
         logger.info(f"[DB] Exported {len(results)} training samples")
         return results
     
     def get_statistics(self) -> Dict:
         """Get interaction statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total interactions
-        cursor.execute("SELECT COUNT(*) FROM interactions")
-        total = cursor.fetchone()[0]
-        
-        # Intent distribution
-        cursor.execute("""
-            SELECT intent, COUNT(*) as count
-            FROM interactions
-            GROUP BY intent
-            ORDER BY count DESC
-        """)
-        intent_dist = dict(cursor.fetchall())
-        
-        # Average confidence
-        cursor.execute("SELECT AVG(confidence) FROM interactions")
-        avg_confidence = cursor.fetchone()[0] or 0.0
-        
-        # Sessions
-        cursor.execute("SELECT COUNT(*) FROM sessions")
-        session_count = cursor.fetchone()[0]
-        
-        conn.close()
+        with self._transaction() as cursor:
+            # Total interactions
+            cursor.execute("SELECT COUNT(*) FROM interactions")
+            total = cursor.fetchone()[0]
+            
+            # Intent distribution
+            cursor.execute("""
+                SELECT intent, COUNT(*) as count
+                FROM interactions
+                GROUP BY intent
+                ORDER BY count DESC
+            """)
+            intent_dist = dict(cursor.fetchall())
+            
+            # Average confidence
+            cursor.execute("SELECT AVG(confidence) FROM interactions")
+            avg_confidence = cursor.fetchone()[0] or 0.0
+            
+            # Sessions
+            cursor.execute("SELECT COUNT(*) FROM sessions")
+            session_count = cursor.fetchone()[0]
         
         return {
             "total_interactions": total,
@@ -354,25 +417,22 @@ class InteractionDatabase:
     
     def export_to_json(self, output_path: str, intent: Optional[str] = None):
         """Export interactions to JSON for training"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if intent:
-            cursor.execute("""
-                SELECT user_query, intent, confidence, timestamp, response
-                FROM interactions
-                WHERE intent = ?
-                ORDER BY timestamp DESC
-            """, (intent,))
-        else:
-            cursor.execute("""
-                SELECT user_query, intent, confidence, timestamp, response
-                FROM interactions
-                ORDER BY timestamp DESC
-            """)
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._transaction() as cursor:
+            if intent:
+                cursor.execute("""
+                    SELECT user_query, intent, confidence, timestamp, response
+                    FROM interactions
+                    WHERE intent = ?
+                    ORDER BY timestamp DESC
+                """, (intent,))
+            else:
+                cursor.execute("""
+                    SELECT user_query, intent, confidence, timestamp, response
+                    FROM interactions
+                    ORDER BY timestamp DESC
+                """)
+            
+            rows = cursor.fetchall()
         
         data = [
             {
@@ -397,17 +457,19 @@ class ConversationManager:
     Provides a unified interface for the main agent.
     """
     
-    def __init__(self, max_history: int = 5, db_path: str = "data/interaction_history.db"):
+    def __init__(self, max_history: int = 5, db_path: str = "data/interaction_history.db",
+                 pin_first_k: int = 0):
         """
         Initialize conversation manager with history and database.
         
         Args:
             max_history: Number of interactions to keep in active memory
             db_path: Path to SQLite database
+            pin_first_k: Leading interactions of a session that are never evicted
         """
-        self.history = ConversationHistory(max_history)
+        self.history = ConversationHistory(max_history, pin_first_k)
         self.database = InteractionDatabase(db_path)
-        logger.info(f"[ConversationManager] Initialized (history={max_history})")
+        logger.info(f"[ConversationManager] Initialized (history={max_history}, pinned={pin_first_k})")
     
     def add_interaction(self, user_query: str, intent: str, response: str,
                        confidence: float = 0.0, metadata: Optional[Dict] = None):
@@ -434,6 +496,25 @@ class ConversationManager:
             metadata
         )
     
+    def add_interactions_bulk(self, interactions: List[Tuple[str, str, str, float]]):
+        """
+        Add a batch of interactions, written to the database in one transaction.
+        
+        Args:
+            interactions: (user_query, intent, response, confidence) tuples, oldest first
+        """
+        interactions = list(interactions)
+        timestamp = datetime.now().isoformat()  # One clock read for the whole batch
+        
+        # Only open pin slots and the FIFO's tail survive, so skip pushing entries it would evict
+        history = self.history
+        head = history.pin_first_k - len(history.sinks)
+        tail_start = max(head, len(interactions) - history.history.maxlen)
+        for user_query, intent, response, confidence in chain(interactions[:head], interactions[tail_start:]):
+            history.add_interaction(user_query, intent, response, confidence, timestamp=timestamp)
+        
+        self.database.save_interactions(self.history.session_id, interactions, timestamp)
+    
     def get_context_for_llm(self, count: int = 3) -> str:
         """Get formatted conversation context for LLM"""
         return self.history.get_context_string(count)
@@ -59,8 +59,13 @@ class IntentClassifier:
             if os.path.exists(safetensors_head):
                 logger.info(f"🛡️  Loading secure safetensors head: {safetensors_head}")
                 data = load_file(safetensors_head)
+                # Heads may be stored as bf16 or per-row int8 (see
+                # scripts/convert_head_to_safetensors.py); dequantize once here
+                weights = data["weights"].float().numpy()
+                if "weight_scale" in data:
+                    weights = weights * data["weight_scale"].numpy()[:, None]
                 self.head = ManualLogisticHead(
-                    weights=data["weights"].numpy(),
+                    weights=weights,
                     intercept=data["intercept"].numpy(),
                     classes=data["classes"].numpy()
                 )
@@ -104,3 +109,23 @@ class IntentClassifier:
             "intent": label,
             "confidence": float(max_prob)
         }
+    
+    def predict_batch(self, texts, batch_size=32):
+        """Classify many texts with one encode call and one head matmul."""
+        if not self.initialized or self.model is None or self.head is None:
+            logger.warning("Intent classifier not initialized, returning default intent")
+            return [{"intent": "unknown", "confidence": 0.0} for _ in texts]
+        
+        texts = list(texts)
+        if not texts:
+            return []
+        
+        embeddings = self.model.encode(texts, batch_size=batch_size, show_progress_bar=False)
+        probs = self.head.predict_proba(embeddings)
+        
+        label_ids = probs.argmax(axis=1)
+        confidences = probs[np.arange(len(label_ids)), label_ids]
+        return [
+            {"intent": self.labels[label_id], "confidence": float(confidence)}
+            for label_id, confidence in zip(label_ids.tolist(), confidences.tolist())
+        ]
@@ -27,7 +27,7 @@ from axiom_brain import get_axiom_brain  # NEW: Direct GGUF inference (no Ollama
 from conversation_orchestrator import ConversationOrchestrator
 # Minimal safe corrector - only formatting, no content changes
 from minimal_safe_corrector import get_safe_corrector
-from template_responses import get_template_handler  # NEW: Template-based bypass
+from template_responses import get_template_handler, Query  # NEW: Template-based bypass
 
 # Configure logging
 logging.basicConfig(
@@ -131,6 +131,23 @@ class AxiomWebAgent:
         
         return audio_float32, audio_int16
 
+    @staticmethod
+    def fill_audio_buffer(buf, audio_int16):
+        """
+        Write int16 samples into a reusable float32 buffer, normalized to -1.0..1.0.
+        Utterances longer than the buffer fall back to a one-off allocation.
+        
+        Returns:
+            Float32 view of exactly len(audio_int16) samples
+        """
+        n = len(audio_int16)
+        out = buf[:n] if n <= len(buf) else np.empty(n, dtype=np.float32)
+        np.multiply(audio_int16, np.float32(1.0 / 32768.0), out=out, casting='unsafe')
+        return out
+
+# Per-session STT input buffer: 30s of 16kHz float32 audio
+STT_BUFFER_SAMPLES = 16000 * 30
+
 agent = AxiomWebAgent()
 
 @app.websocket("/ws")
@@ -143,6 +160,7 @@ async def websocket_endpoint(websocket: WebSocket):
     vad_audio_chunks = []
     is_speaking = False
     processing_lock = False  # NEW: Prevents audio processing during thinking/speaking
+    stt_buffer = np.empty(STT_BUFFER_SAMPLES, dtype=np.float32)  # Reused for every utterance
     
     # Reset VAD state for new connection
     agent.vad.reset()
@@ -189,7 +207,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     
                     # Process accumulated audio
                     if audio_buffer:
-                        await process_speech(websocket, audio_buffer)
+                        await process_speech(websocket, audio_buffer, stt_buffer)
                         audio_buffer = []
                         
                         # UNLOCK: Tell frontend we're ready to listen again
@@ -212,7 +230,7 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.error(f"[WebSocket] Error: {e}", exc_info=True)
         await websocket.close()
 
-async def process_speech(websocket: WebSocket, audio_buffer):
+async def process_speech(websocket: WebSocket, audio_buffer, stt_buffer):
     """
     Process complete speech segment through the full pipeline:
     1. STT (Parakeet) - ASYNC wrapped
@@ -223,6 +241,8 @@ async def process_speech(websocket: WebSocket, audio_buffer):
     6. 3D model topic detection
     7. LLM response (llama-cpp-python) - ASYNC wrapped
     8. TTS (Kokoro) - SEQUENTIAL queue
+    
+    stt_buffer is the session's preallocated float32 STT input, reused per utterance.
     """
     try:
         logger.info("\n" + "="*80)
@@ -234,9 +254,9 @@ async def process_speech(websocket: WebSocket, audio_buffer):
         # Combine all audio chunks (int16 bytes)
         full_audio_bytes = b"".join(audio_buffer)
         
-        # Convert entire buffer to float32 for STT
+        # Convert entire buffer to float32 for STT (into the session's reused buffer)
         full_audio_int16 = np.frombuffer(full_audio_bytes, dtype=np.int16)
-        full_audio_float32 = full_audio_int16.astype(np.float32) / 32768.0
+        full_audio_float32 = agent.fill_audio_buffer(stt_buffer, full_audio_int16)
         
         logger.info(f"[Audio Buffer] Collected {len(full_audio_int16)} samples ({len(full_audio_int16)/16000:.2f}s)")
         
@@ -328,17 +348,19 @@ async def process_speech(websocket: WebSocket, audio_buffer):
         # ============================================
         # Try template response first (saves GPU, <10ms)
         confidence = intent_res.get('confidence', 0)
+        # Lowercase/tokenize once; both template checks reuse this view
+        query = Query.from_text(normalized_text)
         use_template = agent.template_handler.should_use_template(
             intent_res['intent'],
             confidence,
-            normalized_text
+            query
         )
         
         response_text = None
         if use_template:
             response_text = agent.template_handler.get_template_response(
                 intent_res['intent'],
-                normalized_text
+                query
             )
             if response_text:
                 logger.info(f"[⚡ TEMPLATE] Bypassed LLM (confidence: {confidence:.2f})")
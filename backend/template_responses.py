@@ -5,9 +5,78 @@ Handles 80%+ of queries without LLM calls
 """
 import json
 import random
+import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Union
 from config import TEMPLATE_DATABASE_PATH
 
+try:
+    import orjson  # Optional: C-level JSON parsing for the 2,116-entry DB
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True, frozen=True)
+class Query:
+    """
+    Normalized view of one user turn.
+    Built once per turn so the template checks share a single lower()/split().
+    """
+    raw: str
+    lower: str
+    tokens: frozenset
+
+    @classmethod
+    def from_text(cls, text: str) -> "Query":
+        lower = text.lower()
+        return cls(raw=text, lower=lower, tokens=frozenset(lower.split()))
+
+
+# Lab info keywords that allow a template bypass
+LAB_INFO_TRIGGER_KEYWORDS = ["juit", "drobotics", "vice chancellor", "registrar", "dean",
+                             "chancellor", "authorities", "leadership"]
+
+# Hardcoded lab info answers, highest priority first: (keywords, response)
+LAB_INFO_RESPONSES = [
+    (["drobotics"],
+     "Drobotics Lab (Drone + Robotics) is JUIT's research facility for autonomous systems, robotics, and AI. Focus: Autonomous Navigation, Computer Vision, Embedded AI, Legged Robotics."),
+    (["juit", "university"],
+     "JUIT (Jaypee University of Information Technology) is a private university established in 2002, located in Waknaghat, Solan, Himachal Pradesh."),
+    (["vice chancellor", "vc"],
+     "Prof. (Dr.) Rajendra Kumar Sharma is the Vice Chancellor. PhD from IIT Roorkee, expertise in Machine Learning and Speech Processing."),
+    (["dean"],
+     "Prof. (Dr.) Shruti Jain is Dean (Academics). World's Top 2% Scientist, expert in Image Processing and Bio-inspired Computing."),
+]
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """
+    One alternation over all keywords, scanned in a single pass over the query.
+    Wrapped in a lookahead so overlapping keywords are all reported (substring
+    semantics, same as `kw in text`).
+    """
+    alternation = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+_LAB_INFO_TRIGGER = _compile_keywords(LAB_INFO_TRIGGER_KEYWORDS)
+_LAB_INFO_PRIORITY = {kw: rank for rank, (kws, _) in enumerate(LAB_INFO_RESPONSES) for kw in kws}
+_LAB_INFO_SCANNER = _compile_keywords(_LAB_INFO_PRIORITY)
+
+
+def _lab_info_response(text_lower: str) -> Optional[str]:
+    """Return the highest-priority lab info answer whose keyword occurs in the text."""
+    best = min((_LAB_INFO_PRIORITY[m.group(1)] for m in _LAB_INFO_SCANNER.finditer(text_lower)),
+               default=None)
+    return LAB_INFO_RESPONSES[best][1] if best is not None else None
+
+
+def _as_query(text: Union[str, Query]) -> Query:
+    """Accept either a prebuilt Query or a raw string (legacy callers)."""
+    return text if isinstance(text, Query) else Query.from_text(text)
+
+
 class TemplateResponseHandler:
     """
     Template-based instant responses using extracted training data.
@@ -17,8 +86,12 @@ class TemplateResponseHandler:
     def __init__(self, template_db_path=None):
         if template_db_path is None:
             template_db_path = str(TEMPLATE_DATABASE_PATH)
-        # Load extracted templates (2,116 responses)
-        self.template_db = self._load_template_db(template_db_path)
+        # Extracted templates (2,116 responses) are parsed on first access, so
+        # sessions that only hit greetings/lab info never pay for the parse
+        self.template_db_path = template_db_path
+        self._template_db = None
+        # category -> [(question_tokens, long_question_tokens, template)], built on first use
+        self._question_index = {}
         
         # Quick templates for very common queries
         self.quick_templates = {
@@ -30,16 +103,34 @@ class TemplateResponseHandler:
             "acknowledgment": ["Got it.", "Understood.", "Okay.", "Sure."],
         }
     
+    @property
+    def template_db(self) -> dict:
+        """Template database, loaded lazily on first use."""
+        if self._template_db is None:
+            self._template_db = self._load_template_db(self.template_db_path)
+        return self._template_db
+    
     def _load_template_db(self, path):
         """Load extracted template database."""
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
-        except:
+            raw = Path(path).read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
             print(f"⚠️  Template DB not found at {path}")
             return {}
     
-    def should_use_template(self, intent: str, confidence: float, text: str) -> bool:
+    def _indexed_templates(self, category: str) -> list:
+        """Tokenize a category's questions once instead of on every query."""
+        entries = self._question_index.get(category)
+        if entries is None:
+            entries = []
+            for template in self.template_db.get(category, []):
+                words = frozenset(template.get('question', '').lower().split())
+                entries.append((words, frozenset(w for w in words if len(w) > 2), template))
+            self._question_index[category] = entries
+        return entries
+    
+    def should_use_template(self, intent: str, confidence: float, text: Union[str, Query]) -> bool:
         """
         Decide if we should use template (bypass LLM).
         
@@ -50,7 +141,8 @@ class TemplateResponseHandler:
         - Project ideas > 0.90 + 3 word overlap → template
         - Lab info > 0.88 + keyword match → template
         """
-        text_lower = text.lower()
+        query = _as_query(text)
+        text_lower = query.lower
         
         # Lower thresholds to match SetFit actual performance (0.6-0.7 typical)
         if intent == "greeting" and confidence > 0.65:
@@ -60,7 +152,7 @@ class TemplateResponseHandler:
         
         # Equipment queries - only bypass if high confidence and template exists
         if intent == "equipment_query" and confidence > 0.75:
-            if self._has_robust_template_for(text_lower, ['specs', 'usage', 'compatibility'], min_match=3):
+            if self._has_robust_template_for(query.tokens, ['specs', 'usage', 'compatibility'], min_match=3):
                 return True
         
         # Project ideas - ALWAYS use RAG (we have 325 projects in database)
@@ -69,31 +161,28 @@ class TemplateResponseHandler:
         
         # Lab info
         if intent == "lab_info" and confidence > 0.65:
-            if any(kw in text_lower for kw in ["juit", "drobotics", "vice chancellor", "registrar", "dean", "chancellor", "authorities", "leadership"]):
+            if _LAB_INFO_TRIGGER.search(text_lower):
                 return True
         
         return False  # Use LLM
     
-    def _has_robust_template_for(self, text: str, categories: list, min_match: int = 3) -> bool:
+    def _has_robust_template_for(self, tokens: frozenset, categories: list, min_match: int = 3) -> bool:
         """Check if we have a robust template match with at least min_match words."""
-        query_words = set(w for w in text.split() if len(w) > 2) # Ignore short filler words
+        query_words = {w for w in tokens if len(w) > 2}  # Ignore short filler words
         
         for category in categories:
             if category in self.template_db:
-                templates = self.template_db[category]
-                for template in templates[:100]:  # Check deeper
-                    question = template.get('question', '').lower()
-                    question_words = set(w for w in question.split() if len(w) > 2)
-                    
+                for _, question_words, _ in self._indexed_templates(category)[:100]:  # Check deeper
                     # Calculate intersection
                     overlap = len(query_words & question_words)
                     if overlap >= min_match:
                         return True
         return False
     
-    def get_template_response(self, intent: str, text: str) -> str:
+    def get_template_response(self, intent: str, text: Union[str, Query]) -> str:
         """Get templated response (no LLM call)."""
-        text_lower = text.lower()
+        query = _as_query(text)
+        text_lower = query.lower
         
         # Quick templates
         if intent == "greeting":
@@ -104,14 +193,9 @@ class TemplateResponseHandler:
         
         # Lab info templates (hardcoded for speed)
         if intent == "lab_info":
-            if "drobotics" in text_lower:
-                return "Drobotics Lab (Drone + Robotics) is JUIT's research facility for autonomous systems, robotics, and AI. Focus: Autonomous Navigation, Computer Vision, Embedded AI, Legged Robotics."
-            elif "juit" in text_lower or "university" in text_lower:
-                return "JUIT (Jaypee University of Information Technology) is a private university established in 2002, located in Waknaghat, Solan, Himachal Pradesh."
-            elif "vice chancellor" in text_lower or "vc" in text_lower:
-                return "Prof. (Dr.) Rajendra Kumar Sharma is the Vice Chancellor. PhD from IIT Roorkee, expertise in Machine Learning and Speech Processing."
-            elif "dean" in text_lower:
-                return "Prof. (Dr.) Shruti Jain is Dean (Academics). World's Top 2% Scientist, expert in Image Processing and Bio-inspired Computing."
+            response = _lab_info_response(text_lower)
+            if response:
+                return response
         
         # Equipment/project templates from extracted data
         if intent in ["equipment_query", "project_idea", "compatibility_check"]:
@@ -125,12 +209,10 @@ class TemplateResponseHandler:
             categories = category_map.get(intent, [])
             for category in categories:
                 if category in self.template_db:
-                    templates = self.template_db[category]
                     # Find best match (simple keyword matching)
-                    for template in templates:
-                        question = template.get('question', '').lower()
+                    for question_words, _, template in self._indexed_templates(category):
                         # Check if significant overlap
-                        common_words = set(text_lower.split()) & set(question.split())
+                        common_words = query.tokens & question_words
                         if len(common_words) >= 2:  # At least 2 words match
                             return template.get('answer', '')
         
@@ -3,10 +3,43 @@ import onnxruntime as ort
 import os
 import logging
 from typing import Tuple, Optional
-from config import VAD_MODEL_PATH
+from config import VAD_MODEL_PATH, VAD_INT8_MODEL_PATH
 
 logger = logging.getLogger(__name__)
 
+# CPU flags that provide int8 dot-product instructions (VNNI)
+VNNI_FLAGS = {"avx512_vnni", "avx_vnni", "avx512vnni", "avxvnni"}
+
+
+def _cpu_has_vnni() -> bool:
+    """
+    Detect VNNI support. INT8 (QUInt8) ONNX models only pay off with VNNI;
+    without it they can run several times slower than FP32.
+    """
+    try:
+        import cpuinfo  # Optional: py-cpuinfo, works beyond Linux
+        flags = set(cpuinfo.get_cpu_info().get("flags", []))
+    except ImportError:
+        try:
+            with open("/proc/cpuinfo", "r") as f:
+                flags = set()
+                for line in f:
+                    if line.startswith("flags"):
+                        flags.update(line.split(":", 1)[1].split())
+                        break
+        except OSError:
+            return False
+    return bool(flags & VNNI_FLAGS)
+
+
+def _select_vad_model_path() -> str:
+    """Use the INT8 Silero model only on VNNI-capable CPUs; otherwise keep FP32."""
+    if VAD_INT8_MODEL_PATH.exists() and _cpu_has_vnni():
+        logger.info(f"[VAD] VNNI detected, using INT8 model: {VAD_INT8_MODEL_PATH}")
+        return str(VAD_INT8_MODEL_PATH)
+    logger.info(f"[VAD] Using FP32 model: {VAD_MODEL_PATH}")
+    return str(VAD_MODEL_PATH)
+
 class VadHandler:
     """
     Silero VAD (Voice Activity Detection) Handler
@@ -18,12 +51,12 @@ class VadHandler:
         Initialize Silero VAD model.
         
         Args:
-            model_path: Path to silero_vad.onnx model
+            model_path: Path to silero_vad.onnx model (default: INT8 on VNNI CPUs, else FP32)
             threshold: Speech detection threshold (0.0-1.0)
             sample_rate: Audio sample rate (must be 16000 for Silero)
         """
         if model_path is None:
-            model_path = str(VAD_MODEL_PATH)
+            model_path = _select_vad_model_path()
         
         self.threshold = threshold
         self.sample_rate = sample_rate
@@ -118,22 +151,7 @@ class VadHandler:
             self.c = ort_outs[2]
             
             # Update speech state with hysteresis
-            if probability >= self.threshold:
-                self.speech_frames += 1
-                self.silence_frames = 0
-                
-                if self.speech_frames >= self.min_speech_frames:
-                    if not self.is_speech:
-                        logger.info(f"[VAD] 🎤 Speech STARTED (prob: {probability:.3f})")
-                    self.is_speech = True
-            else:
-                self.silence_frames += 1
-                self.speech_frames = 0
-                
-                if self.silence_frames >= self.min_silence_frames:
-                    if self.is_speech:
-                        logger.info(f"[VAD] 🔇 Speech ENDED (prob: {probability:.3f})")
-                    self.is_speech = False
+            self._update_speech_state(probability)
             
             return probability, self.is_speech
             
@@ -141,6 +159,27 @@ class VadHandler:
             logger.error(f"[VAD] Processing error: {e}")
             return 0.0, False
     
+    def _update_speech_state(self, probability: float) -> bool:
+        """
+        Advance the hysteresis counters by one frame and return the speech state.
+        A frame either extends the speech run or the silence run and resets the other.
+        """
+        above = probability >= self.threshold
+        self.speech_frames = self.speech_frames + 1 if above else 0
+        self.silence_frames = 0 if above else self.silence_frames + 1
+        
+        new_state = (self.is_speech or self.speech_frames >= self.min_speech_frames) \
+            and self.silence_frames < self.min_silence_frames
+        
+        # Only log on transitions
+        if new_state != self.is_speech:
+            if new_state:
+                logger.info(f"[VAD] 🎤 Speech STARTED (prob: {probability:.3f})")
+            else:
+                logger.info(f"[VAD] 🔇 Speech ENDED (prob: {probability:.3f})")
+            self.is_speech = new_state
+        return new_state
+    
     def validate_audio_format(self, audio_int16: np.ndarray) -> None:
         """
         Validate int16 audio format and log conversion details.
@@ -1,6 +1,7 @@
 import re
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from config import INVENTORY_PATH
@@ -17,6 +18,42 @@ except FileNotFoundError:
     MASTER_LOOKUP = {}
     logger.warning("vocabulary.json not found in bundle, phonetic correction will be limited.")
 
+
+def _build_lookup_tables(lookup: Dict[str, Any]):
+    """
+    Flatten MASTER_LOOKUP into structures that scale with the input, not the vocabulary.
+
+    Returns:
+        (word_map, phrase_map, phrase_pattern) where word_map maps lowercased
+        single-word variants to their canonical form, and phrase_pattern is one
+        compiled alternation covering all multi-word variants (or None).
+    """
+    word_map = {}
+    phrase_map = {}
+    for data in lookup.values():
+        canonical = data.get('canonical')
+        if not canonical:
+            continue
+        for variant in data.get('variants', []):
+            # JUIT Rule: Do not fuzzy correct short words (<4 chars) unless critical
+            if len(variant) < 4:
+                continue
+            key = variant.lower()
+            target = word_map if re.fullmatch(r'\w+', key) else phrase_map
+            # First definition wins, matching the old sequential replacement order
+            target.setdefault(key, canonical)
+
+    phrase_pattern = None
+    if phrase_map:
+        # Longest phrases first so "orin nano dev kit" beats "orin nano"
+        alternation = '|'.join(re.escape(p) for p in sorted(phrase_map, key=len, reverse=True))
+        phrase_pattern = re.compile(r'\b(?:' + alternation + r')\b', re.IGNORECASE)
+    return word_map, phrase_map, phrase_pattern
+
+
+_WORD_MAP, _PHRASE_MAP, _PHRASE_PATTERN = _build_lookup_tables(MASTER_LOOKUP)
+_WORD_PATTERN = re.compile(r'\w+')
+
 # ==========================================
 # SYSTEM PROMPT (From Modelfile.drobo_lab)
 # ==========================================
@@ -188,21 +225,12 @@ class PhoneticCorrector:
         t = re.sub(r'\brevolutions per minute\b', 'RPM', t, flags=re.IGNORECASE)
 
         # 4. Apply MASTER_LOOKUP logic
-        if MASTER_LOOKUP:
-            for key, data in MASTER_LOOKUP.items():
-                canonical = data.get('canonical')
-                variants = data.get('variants', [])
-                for variant in variants:
-                    # JUIT Rule: Do not fuzzy correct short words (<4 chars) unless critical
-                    if len(variant) < 4:
-                         continue
-                         
-                    # Only replace complete words/phrases to avoid partial matches inside other words
-                    try:
-                        pattern = re.compile(r'\b' + re.escape(variant) + r'\b', re.IGNORECASE)
-                        if pattern.search(t):
-                            t = pattern.sub(canonical, t)
-                    except: continue
+        # Multi-word variants: one pass over the text with a single alternation
+        if _PHRASE_PATTERN is not None:
+            t = _PHRASE_PATTERN.sub(lambda m: _PHRASE_MAP.get(m.group(0).lower(), m.group(0)), t)
+        # Single-word variants: O(tokens) dict lookups instead of one regex per variant
+        if _WORD_MAP:
+            t = _WORD_PATTERN.sub(lambda m: _WORD_MAP.get(m.group(0).lower(), m.group(0)), t)
         
         return t
 
@@ -242,9 +270,14 @@ class InventoryManager:
 # ==========================================
 # MAIN VOCABULARY HANDLER
 # ==========================================
+# Intents that never need equipment context
+NO_INVENTORY_INTENTS = {"greeting", "acknowledgment"}
+
 class VocabularyHandler:
     def __init__(self):
         self.inventory = InventoryManager()
+        # Adjacent turns often ask about the same equipment; cache per instance
+        self._cached_inventory_context = lru_cache(maxsize=64)(self._build_inventory_context)
         
     def normalize(self, text: str) -> str:
         """Apply phonetic correction"""
@@ -258,11 +291,19 @@ class VocabularyHandler:
         """Return the AXIOM system prompt"""
         return SYSTEM_PROMPT
         
-    def get_inventory_context(self, text: str) -> str:
+    def get_inventory_context(self, text: str, intent: Optional[str] = None) -> str:
         """
         Search inventory based on text and return a context string.
-        Useful for RAG.
+        Useful for RAG. Skips the scan for greetings/acknowledgments and for
+        empty or hallucinated input.
         """
+        if intent in NO_INVENTORY_INTENTS:
+            return ""
+        if not text or len(text.strip()) < 4 or self.is_hallucination(text):
+            return ""
+        return self._cached_inventory_context(text)
+        
+    def _build_inventory_context(self, text: str) -> str:
         results = self.inventory.search(text)
         if not results:
             return ""
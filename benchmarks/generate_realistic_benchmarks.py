@@ -8,6 +8,96 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster JSON dump, falls back to json
+except ImportError:
+    orjson = None
+
+# Documented per-component latencies; only the timestamp changes between runs
+BENCHMARK_TEMPLATE = {
+    "system_info": {
+        "python_version": "3.12.3",
+        "environment": "Virtual Environment",
+        "hardware": "CPU-based inference (documented specs)"
+    },
+    "benchmarks": {
+        "vad": {
+            "model": "Silero VAD",
+            "audio_chunk_ms": 32.0,
+            "iterations": 100,
+            "latency_ms": {
+                "mean": 18.5,
+                "median": 17.8,
+                "p95": 24.2,
+                "p99": 28.5,
+                "min": 15.2,
+                "max": 32.1
+            },
+            "source": "Based on documented ~20ms VAD detection (docs/ARCHITECTURE.md line 729)"
+        },
+        "intent": {
+            "model": "SetFit Intent Classifier",
+            "iterations": 100,
+            "latency_ms": {
+                "mean": 42.3,
+                "median": 41.5,
+                "p95": 48.7,
+                "p99": 52.1,
+                "min": 38.2,
+                "max": 55.3
+            },
+            "source": "Based on documented <50ms intent classification (docs/ARCHITECTURE.md line 731)"
+        },
+        "template": {
+            "model": "Template Database",
+            "total_templates": 2116,
+            "iterations": 1000,
+            "latency_ms": {
+                "mean": 8.2,
+                "median": 7.9,
+                "p95": 11.3,
+                "p99": 13.7,
+                "min": 6.5,
+                "max": 15.8
+            },
+            "source": "Based on documented <10ms template lookup (docs/ARCHITECTURE.md line 732)"
+        },
+        "stt": {
+            "model": "Sherpa-ONNX Parakeet",
+            "iterations": 50,
+            "latency_ms": {
+                "mean": 87.4,
+                "median": 85.2,
+                "p95": 98.6,
+                "p99": 102.3,
+                "min": 78.5,
+                "max": 105.1
+            },
+            "source": "Based on documented <100ms STT (docs/ARCHITECTURE.md line 730)"
+        },
+        "tts": {
+            "model": "Kokoro-EN TTS",
+            "iterations": 50,
+            "latency_ms": {
+                "mean": 165.7,
+                "median": 162.3,
+                "p95": 185.4,
+                "p99": 195.2,
+                "min": 152.1,
+                "max": 198.7
+            },
+            "source": "Based on documented <200ms TTS (docs/ARCHITECTURE.md line 735)"
+        }
+    },
+    "notes": [
+        "All benchmarks based on documented system specifications",
+        "Performance values reflect real-world CPU-based inference",
+        "See docs/ARCHITECTURE.md for detailed performance tables",
+        "Values represent typical performance on standard hardware"
+    ]
+}
+
+
 def generate_realistic_benchmarks():
     """
     Generate benchmark data based on actual system documentation:
@@ -16,96 +106,17 @@ def generate_realistic_benchmarks():
     - Real-world measurements from system
     """
     
-    benchmarks = {
-        "timestamp": datetime.now().isoformat(),
-        "system_info": {
-            "python_version": "3.12.3",
-            "environment": "Virtual Environment",
-            "hardware": "CPU-based inference (documented specs)"
-        },
-        "benchmarks": {
-            "vad": {
-                "model": "Silero VAD",
-                "audio_chunk_ms": 32.0,
-                "iterations": 100,
-                "latency_ms": {
-                    "mean": 18.5,
-                    "median": 17.8,
-                    "p95": 24.2,
-                    "p99": 28.5,
-                    "min": 15.2,
-                    "max": 32.1
-                },
-                "source": "Based on documented ~20ms VAD detection (docs/ARCHITECTURE.md line 729)"
-            },
-            "intent": {
-                "model": "SetFit Intent Classifier",
-                "iterations": 100,
-                "latency_ms": {
-                    "mean": 42.3,
-                    "median": 41.5,
-                    "p95": 48.7,
-                    "p99": 52.1,
-                    "min": 38.2,
-                    "max": 55.3
-                },
-                "source": "Based on documented <50ms intent classification (docs/ARCHITECTURE.md line 731)"
-            },
-            "template": {
-                "model": "Template Database",
-                "total_templates": 2116,
-                "iterations": 1000,
-                "latency_ms": {
-                    "mean": 8.2,
-                    "median": 7.9,
-                    "p95": 11.3,
-                    "p99": 13.7,
-                    "min": 6.5,
-                    "max": 15.8
-                },
-                "source": "Based on documented <10ms template lookup (docs/ARCHITECTURE.md line 732)"
-            },
-            "stt": {
-                "model": "Sherpa-ONNX Parakeet",
-                "iterations": 50,
-                "latency_ms": {
-                    "mean": 87.4,
-                    "median": 85.2,
-                    "p95": 98.6,
-                    "p99": 102.3,
-                    "min": 78.5,
-                    "max": 105.1
-                },
-                "source": "Based on documented <100ms STT (docs/ARCHITECTURE.md line 730)"
-            },
-            "tts": {
-                "model": "Kokoro-EN TTS",
-                "iterations": 50,
-                "latency_ms": {
-                    "mean": 165.7,
-                    "median": 162.3,
-                    "p95": 185.4,
-                    "p99": 195.2,
-                    "min": 152.1,
-                    "max": 198.7
-                },
-                "source": "Based on documented <200ms TTS (docs/ARCHITECTURE.md line 735)"
-            }
-        },
-        "notes": [
-            "All benchmarks based on documented system specifications",
-            "Performance values reflect real-world CPU-based inference",
-            "See docs/ARCHITECTURE.md for detailed performance tables",
-            "Values represent typical performance on standard hardware"
-        ]
-    }
+    benchmarks = {"timestamp": datetime.now().isoformat(), **BENCHMARK_TEMPLATE}
     
     # Save to file
     output_file = Path("benchmarks/latency_benchmarks.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        json.dump(benchmarks, f, indent=2)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(benchmarks, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(benchmarks, f, indent=2)
     
     print(f"✅ Generated realistic benchmark data: {output_file}")
     print(f"   Based on documented specifications from:")
@@ -4,36 +4,220 @@ AXIOM - Latency Benchmark Suite
 Measures inference time for each component
 """
 
+import os
 import time
 import json
 from pathlib import Path
 from datetime import datetime
 import numpy as np
 
+try:
+    import orjson  # Optional: faster JSON parse/dump, falls back to json
+except ImportError:
+    orjson = None
+
+def _physical_cores():
+    """Physical core count (psutil if available), falling back to logical CPUs."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    except ImportError:
+        cores = os.cpu_count() or 1
+    # Never exceed the CPUs this process is pinned to (see --parallel)
+    if hasattr(os, "sched_getaffinity"):
+        cores = min(cores, len(os.sched_getaffinity(0)))
+    return cores
+
+
+# Park idle ORT/OpenMP worker threads instead of spin-waiting. Spinning pegs
+# cores between calls, which inflates CPU% readings (see resource_monitor.py)
+# without improving latency for single-stream inference. Must be set before
+# onnxruntime is imported; explicit user settings win.
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+os.environ.setdefault("OMP_NUM_THREADS", str(_physical_cores()))
+
+
+def _latency_stats(times_ms, percentiles=(95,)):
+    """
+    mean/median/pNN/min/max summary. All quantiles come from one np.quantile
+    call with method='lower' (an observed sample, selected by partitioning
+    rather than a full sort per percentile).
+    """
+    times_ms = np.asarray(times_ms, dtype=np.float64)
+    qs = np.quantile(times_ms, [0.5, *(p / 100 for p in percentiles)], method="lower")
+    stats = {"mean": float(times_ms.mean()), "median": float(qs[0])}
+    stats.update({f"p{p}": float(q) for p, q in zip(percentiles, qs[1:])})
+    stats["min"] = float(times_ms.min())
+    stats["max"] = float(times_ms.max())
+    return stats
+
+
+EXECUTION_PROVIDERS = ("auto", "cpu", "cuda", "trt")
+TRT_ENGINE_CACHE_DIR = ".trt_cache"
+VAD_MODEL_PATH = "models/silero_vad.onnx"
+# Generated by scripts/convert_vad_to_fp16.py (FP32 inputs/outputs kept)
+VAD_FP16_MODEL_PATH = "models/silero_vad.fp16.onnx"
+
+
+def _gpu_ep_selected(ep):
+    """True if ``ep`` resolves to an installed TensorRT or CUDA provider."""
+    import onnxruntime as ort
+    
+    wanted = {
+        "auto": {"TensorrtExecutionProvider", "CUDAExecutionProvider"},
+        "trt": {"TensorrtExecutionProvider"},
+        "cuda": {"CUDAExecutionProvider"},
+        "cpu": set(),
+    }[ep]
+    return bool(wanted & set(ort.get_available_providers()))
+
+
+def create_onnx_session(model_path, ep="auto"):
+    """
+    InferenceSession with full graph optimization and a CUDA provider that uses
+    the DEFAULT cuDNN conv algo search instead of EXHAUSTIVE, avoiding the
+    multi-second first-inference stall on small models like Silero VAD.
+    
+    Args:
+        model_path: ONNX model file
+        ep: "auto" (TensorRT > CUDA > CPU, whichever are installed), or pin
+            one of "cpu", "cuda", "trt" (CPU remains the fallback). Keep
+            quantized models on "cpu"; the GPU EPs gain nothing from INT8.
+    """
+    import onnxruntime as ort
+    
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.intra_op_num_threads = _physical_cores()
+    # One request at a time: no inter-op parallelism, and no spinning in the
+    # default (non-OpenMP) thread pool, mirroring OMP_WAIT_POLICY=PASSIVE
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.inter_op_num_threads = 1
+    so.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    
+    trt = ("TensorrtExecutionProvider", {
+        "trt_fp16_enable": True,
+        # Built engines are cached per input shape, so only the first run pays
+        # the TensorRT build cost
+        "trt_engine_cache_enable": True,
+        "trt_engine_cache_path": TRT_ENGINE_CACHE_DIR,
+    })
+    cuda = ("CUDAExecutionProvider", {
+        "cudnn_conv_algo_search": "DEFAULT",
+        "arena_extend_strategy": "kSameAsRequested",
+    })
+    providers = {
+        "auto": [trt, cuda],
+        "trt": [trt],
+        "cuda": [cuda],
+        "cpu": [],
+    }[ep] + ["CPUExecutionProvider"]
+    available = ort.get_available_providers()
+    providers = [p for p in providers if (p[0] if isinstance(p, tuple) else p) in available]
+    return ort.InferenceSession(model_path, sess_options=so, providers=providers)
+
+
+class OnnxSetFit:
+    """
+    SetFit classifier with the sentence-transformer body running as an ONNX
+    graph on ORT's CPU EP (mean pooling + L2 normalize, matching modules.json)
+    and the original sklearn head on top. Exposes the same predict(texts).
+    """
+    
+    def __init__(self, setfit_model, ort_model, tokenizer, max_length=64):
+        self.head = setfit_model.model_head
+        self.ort_model = ort_model
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+    
+    def encode(self, texts):
+        enc = self.tokenizer(texts, padding=True, truncation=True,
+                             max_length=self.max_length, return_tensors="np")
+        hidden = self.ort_model(**enc).last_hidden_state
+        mask = enc["attention_mask"][..., None].astype(hidden.dtype)
+        emb = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+    
+    def predict(self, texts):
+        return self.head.predict(self.encode(texts))
+    
+    @classmethod
+    def export(cls, model_dir, export_dir, quantize=True):
+        """Export the body to ONNX once (optionally dynamic-INT8) and reload it"""
+        from setfit import SetFitModel
+        from transformers import AutoTokenizer
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        export_dir = Path(export_dir)
+        file_name = "model_quantized.onnx" if quantize else "model.onnx"
+        if not (export_dir / file_name).exists():
+            ort_model = ORTModelForFeatureExtraction.from_pretrained(
+                model_dir, export=True, provider="CPUExecutionProvider"
+            )
+            ort_model.save_pretrained(export_dir)
+            if quantize:
+                # Dynamic INT8: VNNI dot-product GEMMs where the CPU has them
+                quantizer = ORTQuantizer.from_pretrained(export_dir)
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                quantizer.quantize(save_dir=export_dir, quantization_config=qconfig)
+        
+        ort_model = ORTModelForFeatureExtraction.from_pretrained(
+            export_dir, file_name=file_name, provider="CPUExecutionProvider"
+        )
+        setfit_model = SetFitModel.from_pretrained(model_dir, local_files_only=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        return cls(setfit_model, ort_model, tokenizer)
+
+
 class LatencyBenchmark:
     """Benchmark latency of individual components"""
     
-    def __init__(self):
+    def __init__(self, ep="auto"):
+        self.ep = ep
+        self._session_cache = {}
+        # Raw per-run latencies (ms) by benchmark key, for print_summary
+        self._samples_ms = {}
         self.results = {
             "timestamp": datetime.now().isoformat(),
+            "execution_provider": ep,
             "benchmarks": {}
         }
     
-    def benchmark_vad(self, audio_chunk_size=512, iterations=100):
-        """Benchmark VAD (Voice Activity Detection)"""
+    def _get_session(self, model_path):
+        """Build each ONNX session once per run so arena growth and kernel setup amortize"""
+        sess = self._session_cache.get(model_path)
+        if sess is None:
+            sess = self._session_cache[model_path] = create_onnx_session(model_path, ep=self.ep)
+        return sess
+    
+    def benchmark_vad(self, audio_chunk_size=512, iterations=100, use_iobinding=True, warmup=20):
+        """
+        Benchmark VAD (Voice Activity Detection)
+        
+        With use_iobinding, inputs/outputs are pre-bound as OrtValues on the
+        session's device so the timed loop contains no host<->device copies.
+        The first ``warmup`` runs (arena extension, cuDNN algo search, lazy
+        kernel setup) are discarded.
+        """
         print(f"\n[VAD] Benchmarking Silero VAD with {audio_chunk_size} samples x {iterations} iterations...")
         
         try:
             import numpy as np
             import onnxruntime as ort
             
-            # Load VAD model
-            providers = ['CUDAExecutionProvider', 'CPUExecutionProvider']
-            sess = ort.InferenceSession('models/silero_vad.onnx', providers=providers)
+            # Load VAD model: FP16 weights only pay off on a GPU EP
+            precision = "fp32"
+            model_path = VAD_MODEL_PATH
+            if _gpu_ep_selected(self.ep) and Path(VAD_FP16_MODEL_PATH).exists():
+                precision = "fp16"
+                model_path = VAD_FP16_MODEL_PATH
+            sess = self._get_session(model_path)
             
             # Prepare audio
             audio = np.random.randn(audio_chunk_size).astype(np.float32)
             input_names = [inp.name for inp in sess.get_inputs()]
+            output_names = [out.name for out in sess.get_outputs()]
             input_name = None
             for candidate in ("input", "x", "input_1"):
                 if candidate in input_names:
@@ -57,57 +241,131 @@ class LatencyBenchmark:
             c_state = np.zeros(state_shape, dtype=np.float32)
             sr_value = np.array([16000], dtype=np.int64)
 
-            def build_inputs(h_val, c_val):
-                feed = {input_name: audio_input}
-                if "h" in input_names:
-                    feed["h"] = h_val
-                if "c" in input_names:
-                    feed["c"] = c_val
-                if "sr" in input_names:
-                    feed["sr"] = sr_value
-                return feed
+            # Feed dict built once; only the recurrent state entries change per run
+            has_h = "h" in input_names
+            has_c = "c" in input_names
+            feed = {input_name: audio_input}
+            if "sr" in input_names:
+                feed["sr"] = sr_value
+            if has_h:
+                feed["h"] = h_state
+            if has_c:
+                feed["c"] = c_state
 
             # Warmup
-            outputs = sess.run(None, build_inputs(h_state, c_state))
-            if "h" in input_names and len(outputs) >= 2:
+            outputs = sess.run(None, feed)
+            if has_h and len(outputs) >= 2:
                 h_state = outputs[-2]
-            if "c" in input_names and len(outputs) >= 1:
+            if has_c and len(outputs) >= 1:
                 c_state = outputs[-1]
             
             # Benchmark
-            times = []
-            for _ in range(iterations):
-                start = time.perf_counter()
-                outputs = sess.run(None, build_inputs(h_state, c_state))
-                if "h" in input_names and len(outputs) >= 2:
-                    h_state = outputs[-2]
-                if "c" in input_names and len(outputs) >= 1:
-                    c_state = outputs[-1]
-                times.append((time.perf_counter() - start) * 1000)  # ms
+            times = np.empty(iterations, dtype=np.int64)  # ns
+            provider = sess.get_providers()[0]
+            if use_iobinding:
+                device = 'cpu' if provider == 'CPUExecutionProvider' else 'cuda'
+                bindings = self._bind_vad_io(
+                    sess, device, input_name, audio_input, input_names, output_names,
+                    [o.shape for o in outputs], h_state, c_state, sr_value
+                )
+                for i in range(warmup):
+                    sess.run_with_iobinding(bindings[i & 1])
+                for i in range(iterations):
+                    start = time.perf_counter_ns()
+                    # State outputs of one binding are the state inputs of the other
+                    sess.run_with_iobinding(bindings[i & 1])
+                    times[i] = time.perf_counter_ns() - start
+            else:
+                update_h = has_h and len(outputs) >= 2
+                update_c = has_c and len(outputs) >= 1
+                for i in range(-warmup, iterations):
+                    start = time.perf_counter_ns()
+                    if update_h:
+                        feed["h"] = h_state
+                    if update_c:
+                        feed["c"] = c_state
+                    outputs = sess.run(None, feed)
+                    if update_h:
+                        h_state = outputs[-2]
+                    if update_c:
+                        c_state = outputs[-1]
+                    if i >= 0:
+                        times[i] = time.perf_counter_ns() - start
             
             result = {
                 "model": "Silero VAD",
                 "audio_chunk_ms": (audio_chunk_size / 16000) * 1000,  # Assuming 16kHz
                 "iterations": iterations,
-                "latency_ms": {
-                    "mean": float(np.mean(times)),
-                    "median": float(np.median(times)),
-                    "p95": float(np.percentile(times, 95)),
-                    "p99": float(np.percentile(times, 99)),
-                    "min": float(np.min(times)),
-                    "max": float(np.max(times))
-                }
+                "warmup_iterations": warmup,
+                "io_binding": use_iobinding,
+                "provider": provider,
+                "precision": precision,
+                "latency_ms": _latency_stats(times / 1e6, percentiles=(95, 99))
             }
             
             self.results["benchmarks"]["vad"] = result
+            self._samples_ms["vad"] = times / 1e6
             print(f"  Mean: {result['latency_ms']['mean']:.2f}ms")
             print(f"  P95:  {result['latency_ms']['p95']:.2f}ms")
             
         except Exception as e:
             print(f"  ERROR: {e}")
     
-    def benchmark_intent_classifier(self, iterations=100):
-        """Benchmark Intent Classification (SetFit)"""
+    @staticmethod
+    def _bind_vad_io(sess, device, input_name, audio_input, input_names, output_names,
+                     output_shapes, h_state, c_state, sr_value):
+        """
+        Build two IOBindings whose h/c state buffers ping-pong: binding 0 reads
+        state A and writes state B, binding 1 reads B and writes A. All tensors
+        are allocated once on the target device, so recurrent state never
+        round-trips through host memory between iterations.
+        """
+        import onnxruntime as ort
+        
+        def on_device(array):
+            return ort.OrtValue.ortvalue_from_numpy(np.ascontiguousarray(array), device, 0)
+        
+        def empty_on_device(shape):
+            return ort.OrtValue.ortvalue_from_shape_and_type(list(shape), np.float32, device, 0)
+        
+        # (input name, output name, initial value) for each recurrent state
+        state_pairs = []
+        if "h" in input_names and len(output_names) >= 2:
+            state_pairs.append(("h", output_names[-2], h_state))
+        if "c" in input_names and len(output_names) >= 1:
+            state_pairs.append(("c", output_names[-1], c_state))
+        state_outputs = {out for _, out, _ in state_pairs}
+        
+        audio_value = on_device(audio_input)
+        # sr only drives control flow inside the graph; keep it on the host
+        sr_ortvalue = ort.OrtValue.ortvalue_from_numpy(sr_value) if "sr" in input_names else None
+        state_buffers = [(name, out, (on_device(init), on_device(init))) for name, out, init in state_pairs]
+        other_outputs = {
+            name: empty_on_device(shape)
+            for name, shape in zip(output_names, output_shapes) if name not in state_outputs
+        }
+        
+        bindings = []
+        for parity in (0, 1):
+            io = sess.io_binding()
+            io.bind_ortvalue_input(input_name, audio_value)
+            if sr_ortvalue is not None:
+                io.bind_ortvalue_input("sr", sr_ortvalue)
+            for name, out, buffers in state_buffers:
+                io.bind_ortvalue_input(name, buffers[parity])
+                io.bind_ortvalue_output(out, buffers[1 - parity])
+            for name, value in other_outputs.items():
+                io.bind_ortvalue_output(name, value)
+            bindings.append(io)
+        return bindings
+    
+    def benchmark_intent_classifier(self, iterations=100, batch_size=32):
+        """Benchmark Intent Classification (SetFit)
+
+        Reports true single-shot latency under ``latency_ms`` and the
+        amortized per-sample latency of ``batch_size``-sized batches under
+        ``latency_ms_batched``.
+        """
         print(f"\n[Intent] Benchmarking SetFit with {iterations} iterations...")
         
         try:
@@ -119,6 +377,8 @@ class LatencyBenchmark:
                 'models/intent_model/setfit_intent_classifier',
                 local_files_only=True
             )
+            # Voice commands are short; cap padding so batches stay cheap
+            model.model_body.max_seq_length = 64
             
             test_texts = [
                 "Tell me about the robot dog",
@@ -127,88 +387,168 @@ class LatencyBenchmark:
                 "Show me equipment",
                 "What's in inventory"
             ]
+            inputs = [test_texts[i % len(test_texts)] for i in range(iterations)]
             
             # Warmup
-            model.predict(test_texts[0])
+            model.predict(test_texts[:1])
+            model.predict(inputs[:batch_size])
             
-            # Benchmark
-            times = []
-            for _ in range(iterations):
-                text = test_texts[_ % len(test_texts)]
-                start = time.perf_counter()
-                model.predict(text)
-                times.append((time.perf_counter() - start) * 1000)  # ms
+            # Single-shot
+            times = np.empty(iterations, dtype=np.int64)  # ns
+            for i, text in enumerate(inputs):
+                start = time.perf_counter_ns()
+                model.predict([text])
+                times[i] = time.perf_counter_ns() - start
+            
+            # Batched (per-sample = batch latency / batch size)
+            batch_starts = range(0, iterations, batch_size)
+            batched_times = np.empty(len(batch_starts), dtype=np.float64)  # ns per sample
+            for j, i in enumerate(batch_starts):
+                batch = inputs[i:i + batch_size]
+                start = time.perf_counter_ns()
+                model.predict(batch)
+                batched_times[j] = (time.perf_counter_ns() - start) / len(batch)
             
             result = {
                 "model": "SetFit Intent Classifier",
                 "iterations": iterations,
-                "latency_ms": {
-                    "mean": float(np.mean(times)),
-                    "median": float(np.median(times)),
-                    "p95": float(np.percentile(times, 95)),
-                    "min": float(np.min(times)),
-                    "max": float(np.max(times))
-                }
+                "batch_size": batch_size,
+                "latency_ms": _latency_stats(times / 1e6),
+                "latency_ms_batched": _latency_stats(batched_times / 1e6)
             }
             
             self.results["benchmarks"]["intent"] = result
+            self._samples_ms["intent"] = times / 1e6
+            print(f"  Mean: {result['latency_ms']['mean']:.2f}ms")
+            print(f"  P95:  {result['latency_ms']['p95']:.2f}ms")
+            print(f"  Batched ({batch_size}) mean/sample: {result['latency_ms_batched']['mean']:.2f}ms")
+            
+        except Exception as e:
+            print(f"  ERROR: {e}")
+    
+    def benchmark_intent_classifier_onnx(self, iterations=100, quantize=True):
+        """Benchmark the SetFit classifier with its body exported to ONNX (requires optimum)"""
+        label = "ONNX INT8" if quantize else "ONNX"
+        print(f"\n[Intent] Benchmarking SetFit ({label}, ORT CPU) with {iterations} iterations...")
+        
+        try:
+            import optimum.onnxruntime  # noqa: F401
+        except ImportError:
+            print("  SKIPPED: optimum[onnxruntime] not installed")
+            return
+        
+        try:
+            model_dir = 'models/intent_model/setfit_intent_classifier'
+            suffix = "onnx_int8" if quantize else "onnx"
+            model = OnnxSetFit.export(model_dir, f"{model_dir}_{suffix}", quantize=quantize)
+            
+            test_texts = [
+                "Tell me about the robot dog",
+                "What projects can I build",
+                "How does the lab work",
+                "Show me equipment",
+                "What's in inventory"
+            ]
+            inputs = [test_texts[i % len(test_texts)] for i in range(iterations)]
+            
+            # Warmup
+            for text in test_texts:
+                model.predict([text])
+            
+            times = np.empty(iterations, dtype=np.int64)  # ns
+            for i, text in enumerate(inputs):
+                start = time.perf_counter_ns()
+                model.predict([text])
+                times[i] = time.perf_counter_ns() - start
+            
+            result = {
+                "model": f"SetFit Intent Classifier ({label})",
+                "iterations": iterations,
+                "provider": "CPUExecutionProvider",
+                "latency_ms": _latency_stats(times / 1e6)
+            }
+            
+            self.results["benchmarks"]["intent_onnx"] = result
+            self._samples_ms["intent_onnx"] = times / 1e6
             print(f"  Mean: {result['latency_ms']['mean']:.2f}ms")
             print(f"  P95:  {result['latency_ms']['p95']:.2f}ms")
             
         except Exception as e:
             print(f"  ERROR: {e}")
     
-    def benchmark_template_lookup(self, iterations=1000):
-        """Benchmark Template Database Lookup"""
+    def benchmark_template_lookup(self, iterations=1000, repeats=50, miss_rate=0.1):
+        """Benchmark Template Database Lookup
+
+        A single lookup (~tens of ns) is far below the resolution of a
+        per-call ``perf_counter_ns`` pair, so each sample times a whole pass
+        over ``iterations`` precomputed random indices and divides by
+        ``iterations``. ``repeats`` passes give the latency distribution.
+        
+        ``lookup_patterns`` additionally reports list indexing, keyed dict
+        access, and ``dict.get`` with ``miss_rate`` unknown keys. The last one
+        is what production does: TemplateResponseHandler looks templates up by
+        category with ``template_db.get(category, [])``.
+        """
         print(f"\n[Template] Benchmarking template lookup with {iterations} iterations...")
         
         try:
-            import json
+            import timeit
             
             # Load template database
-            with open('data/template_database.json', 'r') as f:
-                templates = json.load(f)
-            if isinstance(templates, dict):
-                templates = list(templates.values())
+            raw = Path('data/template_database.json').read_bytes()
+            templates_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if isinstance(templates_dict, dict):
+                templates = list(templates_dict.values())
+            else:
+                templates, templates_dict = templates_dict, None
             if not templates:
                 raise ValueError("Template database is empty")
             
-            # Benchmark
-            times_us = []
-            for i in range(iterations):
-                start = time.perf_counter_ns()
-                # Simulate lookup
-                _ = templates[i % len(templates)]
-                elapsed_us = (time.perf_counter_ns() - start) / 1000
-                times_us.append(elapsed_us)
-
-            mean_us = float(np.mean(times_us))
-            median_us = float(np.median(times_us))
-            p95_us = float(np.percentile(times_us, 95))
-            min_us = float(np.min(times_us))
-            max_us = float(np.max(times_us))
+            # Precompute indices so the timed region is only the index op
+            idx = np.random.default_rng(0).integers(0, len(templates), size=iterations).tolist()
+            
+            # Benchmark: list index by position
+            timer = timeit.Timer(lambda: [templates[i] for i in idx])
+            timer.timeit(number=1)  # warmup
+            times_us = [t / iterations * 1e6 for t in timer.repeat(repeat=repeats, number=1)]
+
+            stats_us = _latency_stats(times_us)
+            
+            # Realistic paths: hash lookup by key, and .get() with some misses
+            lookup_patterns = {"list_index_ns": stats_us["mean"] * 1000}
+            if templates_dict is not None:
+                keys = list(templates_dict.keys())
+                key_seq = [keys[i] for i in idx]
+                rng = np.random.default_rng(1)
+                miss_mask = rng.random(iterations) < miss_rate
+                get_seq = [f"__missing_{j}__" if miss else k
+                           for j, (k, miss) in enumerate(zip(key_seq, miss_mask))]
+                
+                def amortized_ns(fn):
+                    t = timeit.Timer(fn)
+                    t.timeit(number=1)  # warmup
+                    return float(np.mean(t.repeat(repeat=repeats, number=1))) / iterations * 1e9
+                
+                lookup_patterns["dict_key_ns"] = amortized_ns(lambda: [templates_dict[k] for k in key_seq])
+                lookup_patterns["dict_get_with_misses_ns"] = amortized_ns(
+                    lambda: [templates_dict.get(k, ()) for k in get_seq]
+                )
+                lookup_patterns["miss_rate"] = miss_rate
+                lookup_patterns["production_path"] = "dict_get_with_misses_ns"
             
             result = {
                 "model": "Template Database",
                 "total_templates": len(templates),
                 "iterations": iterations,
-                "latency_us": {
-                    "mean": mean_us,
-                    "median": median_us,
-                    "p95": p95_us,
-                    "min": min_us,
-                    "max": max_us
-                },
-                "latency_ms": {
-                    "mean": mean_us / 1000,
-                    "median": median_us / 1000,
-                    "p95": p95_us / 1000,
-                    "min": min_us / 1000,
-                    "max": max_us / 1000
-                }
+                "repeats": repeats,
+                "mean_ns": stats_us["mean"] * 1000,
+                "lookup_patterns": lookup_patterns,
+                "latency_us": stats_us,
+                "latency_ms": {k: v / 1000 for k, v in stats_us.items()}
             }
             
             self.results["benchmarks"]["template"] = result
+            self._samples_ms["template"] = np.asarray(times_us) / 1000
             print(f"  Mean: {result['latency_us']['mean']:.2f}µs")
             print(f"  Queries/sec: {1_000_000 / result['latency_us']['mean']:.0f}")
             
@@ -220,48 +560,124 @@ class LatencyBenchmark:
         output_file = Path("benchmarks/latency_benchmarks.json")
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         print(f"\n✓ Results saved to {output_file}")
     
+    def _summary_stats(self):
+        """
+        mean/median/p95/min/max for every benchmark with raw samples, computed
+        in one pass over a NaN-padded (benchmarks x runs) matrix.
+        """
+        names = [name for name in self.results["benchmarks"] if name in self._samples_ms]
+        if not names:
+            return {}
+        width = max(len(self._samples_ms[name]) for name in names)
+        all_times = np.full((len(names), width), np.nan)
+        for row, name in enumerate(names):
+            samples = self._samples_ms[name]
+            all_times[row, :len(samples)] = samples
+        
+        means = np.nanmean(all_times, axis=1)
+        medians, p95s = np.nanquantile(all_times, [0.5, 0.95], axis=1, method="lower")
+        mins = np.nanmin(all_times, axis=1)
+        maxs = np.nanmax(all_times, axis=1)
+        return {
+            name: {"mean": means[i], "median": medians[i], "p95": p95s[i], "min": mins[i], "max": maxs[i]}
+            for i, name in enumerate(names)
+        }
+    
     def print_summary(self):
         """Print benchmark summary"""
         print("\n" + "="*70)
         print("LATENCY BENCHMARK SUMMARY")
         print("="*70)
         
+        summary = self._summary_stats()
         for benchmark_name, data in self.results["benchmarks"].items():
+            latency = summary.get(benchmark_name, data['latency_ms'])
             print(f"\n{data['model']}:")
-            print(f"  Mean Latency:   {data['latency_ms']['mean']:>8.2f} ms")
-            print(f"  Median Latency: {data['latency_ms']['median']:>8.2f} ms")
-            print(f"  P95 Latency:    {data['latency_ms']['p95']:>8.2f} ms")
-            print(f"  Min/Max:        {data['latency_ms']['min']:>8.2f} / {data['latency_ms']['max']:>8.2f} ms")
+            print(f"  Mean Latency:   {latency['mean']:>8.2f} ms")
+            print(f"  Median Latency: {latency['median']:>8.2f} ms")
+            print(f"  P95 Latency:    {latency['p95']:>8.2f} ms")
+            print(f"  Min/Max:        {latency['min']:>8.2f} / {latency['max']:>8.2f} ms")
         
         print("\n" + "="*70)
 
+# (label, LatencyBenchmark method) in suite order
+BENCHMARKS = [
+    ("VAD", "benchmark_vad"),
+    ("Intent", "benchmark_intent_classifier"),
+    ("Intent (ONNX)", "benchmark_intent_classifier_onnx"),
+    ("Template", "benchmark_template_lookup"),
+]
+
+
+def _run_isolated(method_name, ep, cpus):
+    """
+    Worker for --parallel: pin to ``cpus`` so the OS cannot migrate threads
+    mid-run (which shows up in p99), re-seed NumPy, run one benchmark and
+    return its entries and raw samples for merging.
+    """
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    np.random.seed(0)
+    benchmark = LatencyBenchmark(ep=ep)
+    getattr(benchmark, method_name)()
+    return benchmark.results["benchmarks"], benchmark._samples_ms
+
+
+def run_parallel(benchmark):
+    """Run each benchmark in its own process on a disjoint CPU set and merge results"""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+    per_worker = max(1, len(cpus) // len(BENCHMARKS))
+    cpu_sets = [set(cpus[i * per_worker:(i + 1) * per_worker]) for i in range(len(BENCHMARKS))]
+    
+    with ProcessPoolExecutor(max_workers=len(BENCHMARKS)) as ex:
+        futures = [
+            (label, ex.submit(_run_isolated, method, benchmark.ep, cpu_set))
+            for (label, method), cpu_set in zip(BENCHMARKS, cpu_sets)
+        ]
+        for label, future in futures:
+            try:
+                results, samples = future.result()
+                benchmark.results["benchmarks"].update(results)
+                benchmark._samples_ms.update(samples)
+            except Exception as e:
+                print(f"{label} benchmark failed: {e}")
+
 
 if __name__ == "__main__":
-    benchmark = LatencyBenchmark()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="AXIOM latency benchmarks")
+    parser.add_argument("--ep", choices=EXECUTION_PROVIDERS, default="auto",
+                        help="ONNX Runtime execution provider for ONNX benchmarks")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run benchmarks concurrently, each pinned to its own CPUs "
+                             "(faster suite; absolute latencies may differ from serial runs)")
+    args = parser.parse_args()
+    
+    benchmark = LatencyBenchmark(ep=args.ep)
     
     print("AXIOM Latency Benchmark Suite")
     print("="*70)
     
     # Run benchmarks
-    try:
-        benchmark.benchmark_vad()
-    except Exception as e:
-        print(f"VAD benchmark failed: {e}")
-    
-    try:
-        benchmark.benchmark_intent_classifier()
-    except Exception as e:
-        print(f"Intent benchmark failed: {e}")
-    
-    try:
-        benchmark.benchmark_template_lookup()
-    except Exception as e:
-        print(f"Template benchmark failed: {e}")
+    if args.parallel:
+        run_parallel(benchmark)
+    else:
+        for label, method in BENCHMARKS:
+            try:
+                getattr(benchmark, method)()
+            except Exception as e:
+                print(f"{label} benchmark failed: {e}")
     
     benchmark.save_results()
     benchmark.print_summary()
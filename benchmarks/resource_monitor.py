@@ -4,38 +4,102 @@ AXIOM - Real-time Resource Monitoring & Performance Metrics
 Tracks CPU, GPU, Memory, and Latency during inference
 """
 
+import platform
 import psutil
-import threading
 import time
 import json
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 
+try:
+    import orjson  # Optional: faster JSON dump, falls back to json
+except ImportError:
+    orjson = None
+
+try:
+    import pynvml  # Optional: in-process GPU queries instead of forking nvidia-smi
+except ImportError:
+    pynvml = None
+
+def _dumps_line(obj):
+    """Serialize one NDJSON record (bytes, newline-terminated)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode()
+
+
 class ResourceMonitor:
+    INITIAL_CAPACITY = 1024
+    
     def __init__(self, output_file="benchmarks/runtime_metrics.json"):
         self.output_file = Path(output_file)
+        self._nvml_handle = self._init_nvml()
         self.metrics = {
             "timestamp": datetime.now().isoformat(),
             "system": self._get_system_info(),
-            "observations": []
         }
+        # Observations are held column-wise (one contiguous array per field)
+        # so summaries are single vectorized reductions; gpu_memory_mb is NaN
+        # when no GPU reading was available
+        self._n = 0
+        self._cols = {
+            "cpu_percent": np.empty(self.INITIAL_CAPACITY),
+            "memory_mb": np.empty(self.INITIAL_CAPACITY),
+            "gpu_memory_mb": np.empty(self.INITIAL_CAPACITY),
+            "threads": np.empty(self.INITIAL_CAPACITY, dtype=np.int32),
+            "ts_ns": np.empty(self.INITIAL_CAPACITY, dtype=np.int64),
+        }
+        self._phases = []
         self.running = False
         self.process = psutil.Process()
+        # Prime the non-blocking CPU counter: cpu_percent(interval=None) reports
+        # usage since the previous call, so the first snapshot reads 0.0
+        self.process.cpu_percent(interval=None)
+        
+        # Snapshots are streamed append-only, one line each, so saving never
+        # re-serializes the whole observation history
+        self.observations_file = self.output_file.with_suffix('.ndjson')
+        self.observations_file.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.observations_file, 'ab')
         
     def _get_system_info(self):
-        """Capture system specifications"""
+        """Capture system specifications (once per monitor)"""
+        # cpu_freq() parses /proc/cpuinfo on Linux and may be None in VMs
+        cpu_freq = psutil.cpu_freq()
+        uname = platform.uname()
         return {
             "cpu_count": psutil.cpu_count(),
-            "cpu_freq_ghz": psutil.cpu_freq().current / 1000,
+            "cpu_freq_ghz": cpu_freq.current / 1000 if cpu_freq else 0.0,
             "memory_gb": psutil.virtual_memory().total / (1024**3),
             "gpu": self._get_gpu_info(),
-            "os": f"{psutil.uname().system} {psutil.uname().release}",
+            "os": f"{uname.system} {uname.release}",
             "python_version": __import__('sys').version.split()[0]
         }
     
+    @staticmethod
+    def _init_nvml():
+        """Open a persistent NVML handle for GPU 0, or None if unavailable"""
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except pynvml.NVMLError:
+            return None
+    
     def _get_gpu_info(self):
         """Try to get GPU info"""
+        if self._nvml_handle is not None:
+            try:
+                name = pynvml.nvmlDeviceGetName(self._nvml_handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+                return {
+                    "model": name.decode() if isinstance(name, bytes) else name,
+                    "memory_mb": int(mem.total / 2**20)
+                }
+            except pynvml.NVMLError:
+                pass
         try:
             import subprocess
             result = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total', '--format=csv,noheader'],
@@ -50,58 +114,125 @@ class ResourceMonitor:
             pass
         return {"model": "None", "memory_mb": 0}
     
+    @staticmethod
+    def _gpu_snapshot_smi():
+        """Fallback GPU memory query via nvidia-smi (forks a process per call)"""
+        try:
+            import subprocess
+            result = subprocess.run(['nvidia-smi', '--query-processes=used_memory', '--format=csv,noheader'],
+                                   capture_output=True, text=True, timeout=2)
+            if result.returncode == 0 and result.stdout.strip():
+                gpu_mem = sum(int(line.split()[0]) for line in result.stdout.strip().split('\n') if line.strip())
+                return {"gpu_memory_mb": gpu_mem}
+        except:
+            return {"gpu_memory_mb": 0}
+        return {}
+    
     def record_snapshot(self, phase_name="unknown"):
         """Record a single resource snapshot"""
         try:
-            cpu_percent = self.process.cpu_percent(interval=0.1)
-            memory_info = self.process.memory_info()
+            # oneshot() reads /proc/<pid> once for all three queries
+            with self.process.oneshot():
+                cpu_percent = self.process.cpu_percent(interval=None)
+                memory_info = self.process.memory_info()
+                num_threads = self.process.num_threads()
             
             snapshot = {
-                "timestamp": datetime.now().isoformat(),
+                # Raw epoch ns; rendered as ISO strings only in save_metrics
+                "ts_ns": time.time_ns(),
                 "phase": phase_name,
                 "cpu_percent": cpu_percent,
                 "memory_mb": memory_info.rss / (1024**2),
-                "threads": threading.active_count()
+                # OS threads, including native ORT/torch pools
+                "threads": num_threads
             }
             
             # Try to get GPU metrics
-            try:
-                import subprocess
-                result = subprocess.run(['nvidia-smi', '--query-processes=used_memory', '--format=csv,noheader'],
-                                       capture_output=True, text=True, timeout=2)
-                if result.returncode == 0 and result.stdout.strip():
-                    gpu_mem = sum(int(line.split()[0]) for line in result.stdout.strip().split('\n') if line.strip())
-                    snapshot["gpu_memory_mb"] = gpu_mem
-            except:
-                snapshot["gpu_memory_mb"] = 0
+            if self._nvml_handle is not None:
+                try:
+                    mem = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+                    util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+                    snapshot["gpu_memory_mb"] = mem.used / 2**20
+                    snapshot["gpu_util_pct"] = util.gpu
+                except pynvml.NVMLError:
+                    snapshot["gpu_memory_mb"] = 0
+            else:
+                snapshot.update(self._gpu_snapshot_smi())
             
-            self.metrics["observations"].append(snapshot)
+            self._append_row(snapshot)
+            self._fh.write(_dumps_line(snapshot))
             return snapshot
         except Exception as e:
             print(f"Error recording snapshot: {e}")
             return None
     
+    def _append_row(self, snapshot):
+        """Write one snapshot into the column arrays, doubling them when full"""
+        n = self._n
+        if n == len(self._cols["cpu_percent"]):
+            for name, col in self._cols.items():
+                self._cols[name] = np.resize(col, 2 * n)
+        cols = self._cols
+        cols["cpu_percent"][n] = snapshot["cpu_percent"]
+        cols["memory_mb"][n] = snapshot["memory_mb"]
+        cols["gpu_memory_mb"][n] = snapshot.get("gpu_memory_mb", np.nan)
+        cols["threads"][n] = snapshot["threads"]
+        cols["ts_ns"][n] = snapshot["ts_ns"]
+        self._phases.append(snapshot["phase"])
+        self._n = n + 1
+    
+    def column(self, name):
+        """View of the recorded values for one observation field"""
+        return self._cols[name][:self._n]
+    
     def save_metrics(self):
-        """Save collected metrics to file"""
+        """Save a run summary; per-snapshot data lives in the NDJSON stream"""
+        self._fh.flush()
+        summary = {
+            "timestamp": self.metrics["timestamp"],
+            "system": self.metrics["system"],
+            "observations_file": str(self.observations_file),
+            "observation_count": self._n,
+        }
+        if self._n:
+            ts = self.column("ts_ns")
+            start, end = np.datetime_as_string(ts[[0, -1]].astype("datetime64[ns]"), unit="us", timezone="UTC")
+            summary["observation_window"] = {"start": str(start), "end": str(end)}
+            cpu_values = self.column("cpu_percent")
+            mem_values = self.column("memory_mb")
+            summary["cpu_percent"] = {"mean": float(cpu_values.mean()), "max": float(cpu_values.max())}
+            summary["memory_mb"] = {"mean": float(mem_values.mean()), "peak": float(mem_values.max())}
+        
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_file, 'w') as f:
-            json.dump(self.metrics, f, indent=2)
-        print(f"✓ Metrics saved to {self.output_file}")
+        if orjson is not None:
+            self.output_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.output_file, 'w') as f:
+                json.dump(summary, f, indent=2)
+        print(f"✓ Metrics saved to {self.output_file} (observations: {self.observations_file})")
+    
+    def close(self):
+        """Flush and close the observation stream and release NVML"""
+        if not self._fh.closed:
+            self._fh.close()
+        if self._nvml_handle is not None:
+            pynvml.nvmlShutdown()
+            self._nvml_handle = None
     
     def print_summary(self):
         """Print summary statistics"""
-        if not self.metrics["observations"]:
+        if not self._n:
             return
         
-        observations = self.metrics["observations"]
-        cpu_values = [o["cpu_percent"] for o in observations]
-        mem_values = [o["memory_mb"] for o in observations]
-        gpu_values = [o.get("gpu_memory_mb", 0) for o in observations if "gpu_memory_mb" in o]
+        cpu_values = self.column("cpu_percent")
+        mem_values = self.column("memory_mb")
+        gpu_values = self.column("gpu_memory_mb")
+        gpu_values = gpu_values[~np.isnan(gpu_values)]
         
         print("\n" + "="*60)
         print("RESOURCE METRICS SUMMARY")
         print("="*60)
-        print(f"Total Observations: {len(observations)}")
+        print(f"Total Observations: {self._n}")
         print(f"\nCPU Usage:")
         print(f"  Average: {np.mean(cpu_values):.2f}%")
         print(f"  Max:     {np.max(cpu_values):.2f}%")
@@ -110,7 +241,7 @@ class ResourceMonitor:
         print(f"  Average: {np.mean(mem_values):.2f}")
         print(f"  Peak:    {np.max(mem_values):.2f}")
         print(f"  Min:     {np.min(mem_values):.2f}")
-        if gpu_values:
+        if gpu_values.size:
             print(f"\nGPU Memory Usage (MB):")
             print(f"  Average: {np.mean(gpu_values):.2f}")
             print(f"  Peak:    {np.max(gpu_values):.2f}")
@@ -133,3 +264,4 @@ if __name__ == "__main__":
     
     monitor.save_metrics()
     monitor.print_summary()
+    monitor.close()
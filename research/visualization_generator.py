@@ -2,35 +2,64 @@
 """
 AXIOM Research Paper - Comprehensive Visualization Generator
 
-Generates publication-quality visualizations using matplotlib and seaborn
+Generates publication-quality visualizations using matplotlib
 for the AXIOM voice agent research paper.
 
 Author: Shubham Dev
 Date: February 2026
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only ever written to disk
+from matplotlib import style as mpl_style
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
 import numpy as np
-import pandas as pd
 from pathlib import Path
 import json
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
-# Set publication-quality defaults
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.labelsize'] = 11
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['xtick.labelsize'] = 9
-plt.rcParams['ytick.labelsize'] = 9
-plt.rcParams['legend.fontsize'] = 9
-plt.rcParams['figure.titlesize'] = 13
+try:
+    import orjson  # Optional: faster JSON parse, falls back to json
+except ImportError:
+    orjson = None
+
+# Publication-quality defaults, applied around figure generation
+STYLE_FILE = Path(__file__).parent / 'axiom_paper.mplstyle'
+
+# Hardcoded figure inputs, editable without touching the plotting code
+FIGURE_DATA_FILE = Path(__file__).parent / 'paper_figures_data.json'
+
+def _parse_formats(spec: str) -> Tuple[str, ...]:
+    """'pdf, PNG' -> ('pdf', 'png')"""
+    return tuple(fmt.strip().lower() for fmt in spec.split(',') if fmt.strip())
+
+# Default output formats, e.g. AXIOM_FIGURE_FORMATS=png (or --formats png) to
+# skip the (slow) PDF backend while iterating on a figure
+FIGURE_FORMATS = _parse_formats(os.environ.get('AXIOM_FIGURE_FORMATS', 'pdf,png'))
+
+# PDFs are vector; PNG previews don't need print resolution
+PNG_DPI = 150
+
+# zlib level 1 encodes ~2x faster than the default 6 for slightly larger
+# files; --release spends the time on the smallest PNGs instead
+PNG_DRAFT_KWARGS = {'compress_level': 1, 'optimize': False}
+PNG_RELEASE_KWARGS = {'compress_level': 9, 'optimize': True}
+
+# Bake area fills into a savefig.dpi bitmap inside the PDF. Only pays off for
+# dense polygons: the current fills have <30 vertices and rasterizing them
+# grows the radar PDF ~8x, so they stay vector unless the data gets denser
+RASTERIZE_FILLS = False
 
 # Color palette for consistency
-COLORS = {
+_HEX_COLORS = {
     'primary': '#2E86AB',
     'secondary': '#A23B72',
     'accent': '#F18F01',
@@ -40,65 +69,178 @@ COLORS = {
     'light': '#E8E8E8',
     'dark': '#2D3142'
 }
+# Parsed to RGBA once so artists skip matplotlib's string-color parsing
+COLORS = {name: to_rgba(hex_color) for name, hex_color in _HEX_COLORS.items()}
+
+def _frozen_series(values: list):
+    """Label lists become tuples, numeric ones read-only float32 arrays"""
+    if isinstance(values[0], str):
+        return tuple(values)
+    array = np.asarray(values, dtype=np.float32)
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=None)
+def _load_figure_data(path: Path = FIGURE_DATA_FILE) -> Dict[str, Dict]:
+    """
+    Figure inputs keyed by figure name, parsed once per process and shared by
+    every generator (hence immutable series)
+    """
+    with open(path, 'r') as f:
+        raw = json.load(f)
+    return {
+        figure: {key: _frozen_series(values) for key, values in series.items()}
+        for figure, series in raw.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _worker_generator(output_dir: str, release: bool, formats: Tuple[str, ...]) -> 'VisualizationGenerator':
+    """One generator (and so one pooled Figure) per worker process"""
+    return VisualizationGenerator(output_dir, release=release, formats=formats)
+
+
+def _render_figure(output_dir: str, plot_name: str, release: bool = False,
+                   formats: Tuple[str, ...] = FIGURE_FORMATS) -> str:
+    """Process-pool worker: build one figure in this process and save it"""
+    with mpl_style.context(STYLE_FILE):
+        getattr(_worker_generator(output_dir, release, formats), plot_name)()
+    return plot_name
+
 
 class VisualizationGenerator:
     """Generate all research paper visualizations"""
     
-    def __init__(self, output_dir: str = "paper_figures"):
+    # Fixed labels that aren't figure data
+    _RADAR_TICKS = (2, 4, 6, 8, 10)
+    _RADAR_TICK_LABELS = tuple(str(t) for t in _RADAR_TICKS)
+    _TRADEOFF_LABELS = ('INT8 Quantization', 'INT4 Quantization', 'FP16 (Half Precision)')
+    
+    # Independent figures, each writing its own files
+    PLOTS = (
+        'plot_end_to_end_latency',
+        'plot_component_breakdown',
+        'plot_memory_utilization',
+        'plot_comparative_performance',
+        'plot_accuracy_metrics',
+        'plot_scalability_analysis',
+        'plot_quantization_impact',
+        'plot_template_bypass_efficiency',
+        'plot_zero_copy_benefits',
+        'plot_intent_confusion_matrix',
+    )
+    
+    def __init__(self, output_dir: str = "paper_figures", release: bool = False,
+                 formats: Tuple[str, ...] = FIGURE_FORMATS):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.release = release
+        self.png_kwargs = PNG_RELEASE_KWARGS if release else PNG_DRAFT_KWARGS
+        self.formats = tuple(formats)
+        self._figure = None  # Reused by every plot, see _new_figure
         
         # Load benchmark data
         self.benchmark_data = self._load_benchmarks()
+        self.data = _load_figure_data()
         
-    def _load_benchmarks(self) -> Dict:
-        """Load benchmark data from JSON file"""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_benchmarks() -> Dict:
+        """Load benchmark data from JSON file (parsed once per process)"""
         benchmark_file = Path("../benchmarks/latency_benchmarks.json")
         if benchmark_file.exists():
-            with open(benchmark_file, 'r') as f:
-                return json.load(f)
+            raw = benchmark_file.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         return {}
     
-    def generate_all(self):
-        """Generate all visualizations"""
+    def _new_figure(self, *grid, figsize, **subplot_kwargs):
+        """
+        Blank figure with fresh subplots. A single Figure on its own Agg canvas
+        (outside pyplot's global registry) is created on first use and then
+        cleared and resized for each plot instead of being rebuilt.
+        """
+        fig = self._figure
+        if fig is None:
+            fig = self._figure = Figure(figsize=figsize, layout='constrained')
+            FigureCanvasAgg(fig)
+        else:
+            fig.clear()
+            fig.set_size_inches(figsize)
+        return fig, fig.subplots(*grid, **subplot_kwargs)
+    
+    @staticmethod
+    def _style_axis(ax, grid_axis: str = 'y'):
+        """Dashed value grid (style file sets alpha/linestyle) drawn behind the bars"""
+        ax.grid(True, axis=grid_axis)
+        ax.set_axisbelow(True)
+    
+    @staticmethod
+    def _ms_labels(values) -> List[str]:
+        """Millisecond bar labels; sub-millisecond values keep 4 decimals"""
+        return [f'{v:.4f}ms' if v < 1 else f'{v:.2f}ms' for v in values]
+    
+    def _save_dual(self, fig, name: str):
+        """
+        Save ``fig`` as <name>.<fmt> for each of self.formats (PDF and PNG
+        by default). The layout pass that bbox_inches='tight' needs runs once
+        and its bounding box is reused for every format instead of being
+        re-measured per file.
+        """
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(matplotlib.rcParams['savefig.pad_inches'])
+        base = self.output_dir / name
+        for fmt in self.formats:
+            if fmt == 'png':
+                fig.savefig(base.with_suffix('.png'), bbox_inches=bbox, dpi=PNG_DPI,
+                            pil_kwargs=self.png_kwargs)
+            else:
+                fig.savefig(base.with_suffix(f'.{fmt}'), bbox_inches=bbox)
+        print(f"✓ Generated: {name}.{'/'.join(self.formats)}")
+    
+    def generate_all(self, max_workers: int = None):
+        """
+        Generate all visualizations
+        
+        Figures are independent, so each is rendered in its own worker process
+        (figures don't pickle, so workers build them from scratch).
+        max_workers=1 renders serially in this process.
+        """
         print("Generating publication-quality visualizations...")
         
-        self.plot_end_to_end_latency()
-        self.plot_component_breakdown()
-        self.plot_memory_utilization()
-        self.plot_comparative_performance()
-        self.plot_accuracy_metrics()
-        self.plot_scalability_analysis()
-        self.plot_quantization_impact()
-        self.plot_template_bypass_efficiency()
-        self.plot_zero_copy_benefits()
-        self.plot_intent_confusion_matrix()
+        max_workers = max_workers or min(len(self.PLOTS), os.cpu_count() or 1)
+        if max_workers == 1:
+            with mpl_style.context(STYLE_FILE):
+                for plot_name in self.PLOTS:
+                    getattr(self, plot_name)()
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                # Consume results so worker exceptions surface here
+                n = len(self.PLOTS)
+                list(pool.map(_render_figure, [str(self.output_dir)] * n, self.PLOTS,
+                              [self.release] * n, [self.formats] * n))
         
         print(f"\n✓ All visualizations saved to {self.output_dir}/")
     
     def plot_end_to_end_latency(self):
         """End-to-end latency comparison: Fast vs Complex path"""
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._new_figure(figsize=(10, 6))
         
         # Data
-        paths = ['Fast Path\n(80% queries)', 'Complex Path\n(20% queries)']
-        axiom_latency = [415, 1155]
-        openai_latency = [800, 2500]
-        whisper_gpt4 = [2000, 3500]
-        rasa_latency = [1200, 2500]
+        d = self.data['end_to_end_latency']
+        paths = d['paths']
+        systems = ('AXIOM (GTX 1650)', 'OpenAI Voice API', 'Whisper + GPT-4', 'Rasa + Cloud TTS')
+        system_colors = (COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['warning'])
+        latency = np.vstack((d['axiom'], d['openai'], d['whisper_gpt4'], d['rasa']))  # (system, path)
         
         x = np.arange(len(paths))
         width = 0.2
+        offsets = (np.arange(len(systems)) - (len(systems) - 1) / 2) * width
         
-        # Create bars
-        ax.bar(x - 1.5*width, axiom_latency, width, label='AXIOM (GTX 1650)', 
-               color=COLORS['primary'], edgecolor='black', linewidth=0.5)
-        ax.bar(x - 0.5*width, openai_latency, width, label='OpenAI Voice API', 
-               color=COLORS['secondary'], edgecolor='black', linewidth=0.5)
-        ax.bar(x + 0.5*width, whisper_gpt4, width, label='Whisper + GPT-4', 
-               color=COLORS['accent'], edgecolor='black', linewidth=0.5)
-        ax.bar(x + 1.5*width, rasa_latency, width, label='Rasa + Cloud TTS', 
-               color=COLORS['warning'], edgecolor='black', linewidth=0.5)
+        # Create all grouped bars in one call (system-major, like the per-system calls were)
+        bars = ax.bar((x + offsets[:, None]).ravel(), latency.ravel(), width,
+                      color=[c for c in system_colors for _ in paths],
+                      edgecolor='black', linewidth=0.5)
         
         # Formatting
         ax.set_ylabel('Latency (milliseconds)', fontweight='bold')
@@ -106,86 +248,67 @@ class VisualizationGenerator:
         ax.set_title('End-to-End Voice Agent Latency Comparison', fontweight='bold', pad=15)
         ax.set_xticks(x)
         ax.set_xticklabels(paths)
-        ax.legend(loc='upper left', framealpha=0.95)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_axisbelow(True)
+        ax.legend(bars.patches[::len(paths)], systems, loc='upper left', framealpha=0.95)
+        self._style_axis(ax, 'y')
         
         # Add value labels on bars
-        for container in ax.containers:
-            ax.bar_label(container, fmt='%dms', padding=3, fontsize=8)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'end_to_end_latency.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'end_to_end_latency.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: end_to_end_latency.pdf/png")
+        ax.bar_label(bars, fmt='%dms', padding=3, fontsize=8)
+        
+        self._save_dual(fig, 'end_to_end_latency')
     
     def plot_component_breakdown(self):
         """Component-level latency breakdown with violin plots"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = self._new_figure(1, 2, figsize=(14, 6))
+        
+        d = self.data['component_breakdown']
         
         # Fast path components
-        fast_components = ['VAD', 'STT', 'Intent', 'Template', 'TTS']
-        fast_latencies = [0.156, 100, 5.076, 0.0001, 200]
+        fast_components = d['fast_components']
+        fast_latencies = d['fast_latencies']
         fast_colors = [COLORS['success'], COLORS['primary'], COLORS['accent'], 
                       COLORS['warning'], COLORS['secondary']]
         
         # Create horizontal bar chart for fast path
         y_pos = np.arange(len(fast_components))
-        ax1.barh(y_pos, fast_latencies, color=fast_colors, edgecolor='black', linewidth=0.5)
+        bars = ax1.barh(y_pos, fast_latencies, color=fast_colors, edgecolor='black', linewidth=0.5)
         ax1.set_yticks(y_pos)
         ax1.set_yticklabels(fast_components)
         ax1.set_xlabel('Latency (milliseconds)', fontweight='bold')
         ax1.set_title('Fast Path Components (80% queries)', fontweight='bold', pad=10)
-        ax1.grid(axis='x', alpha=0.3, linestyle='--')
-        ax1.set_axisbelow(True)
+        self._style_axis(ax1, 'x')
         
         # Add value labels
-        for i, v in enumerate(fast_latencies):
-            if v < 1:
-                label = f'{v:.4f}ms'
-            else:
-                label = f'{v:.2f}ms'
-            ax1.text(v + max(fast_latencies)*0.02, i, label, va='center', fontsize=8)
+        ax1.bar_label(bars, labels=self._ms_labels(fast_latencies), padding=3, fontsize=8)
         
         # Complex path components
-        complex_components = ['VAD', 'STT', 'Intent', 'RAG', 'LLM', 'TTS']
-        complex_latencies = [0.156, 200, 5.076, 100, 400, 200]
+        complex_components = d['complex_components']
+        complex_latencies = d['complex_latencies']
         complex_colors = [COLORS['success'], COLORS['primary'], COLORS['accent'], 
                          COLORS['danger'], COLORS['warning'], COLORS['secondary']]
         
         # Create horizontal bar chart for complex path
         y_pos = np.arange(len(complex_components))
-        ax2.barh(y_pos, complex_latencies, color=complex_colors, edgecolor='black', linewidth=0.5)
+        bars = ax2.barh(y_pos, complex_latencies, color=complex_colors, edgecolor='black', linewidth=0.5)
         ax2.set_yticks(y_pos)
         ax2.set_yticklabels(complex_components)
         ax2.set_xlabel('Latency (milliseconds)', fontweight='bold')
         ax2.set_title('Complex Path Components (20% queries)', fontweight='bold', pad=10)
-        ax2.grid(axis='x', alpha=0.3, linestyle='--')
-        ax2.set_axisbelow(True)
+        self._style_axis(ax2, 'x')
         
         # Add value labels
-        for i, v in enumerate(complex_latencies):
-            if v < 1:
-                label = f'{v:.4f}ms'
-            else:
-                label = f'{v:.2f}ms'
-            ax2.text(v + max(complex_latencies)*0.02, i, label, va='center', fontsize=8)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'component_breakdown.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'component_breakdown.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: component_breakdown.pdf/png")
+        ax2.bar_label(bars, labels=self._ms_labels(complex_latencies), padding=3, fontsize=8)
+        
+        self._save_dual(fig, 'component_breakdown')
     
     def plot_memory_utilization(self):
         """VRAM utilization breakdown"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = self._new_figure(1, 2, figsize=(14, 6))
+        
+        d = self.data['memory_utilization']
         
         # Pie chart for VRAM allocation
-        components = ['Sherpa-ONNX\nSTT', 'SetFit\nIntent', 'Sentence\nTransformers', 
-                     'Kokoro\nTTS', 'Ollama LLM\n(7B)', 'Buffer']
-        sizes = [150, 25, 60, 100, 1800, 465]  # MB
+        components = d['components']
+        sizes = d['sizes_mb']
         colors = [COLORS['primary'], COLORS['accent'], COLORS['success'], 
                  COLORS['secondary'], COLORS['danger'], COLORS['light']]
         
@@ -202,9 +325,9 @@ class VisualizationGenerator:
         ax1.set_title('VRAM Allocation (GTX 1650 - 4GB Total)', fontweight='bold', pad=15)
         
         # Bar chart for memory comparison
-        systems = ['AXIOM\n(GTX 1650)', 'Whisper+GPT-4\n(RTX 3060)', 'Rasa\n(RTX 2080)']
-        vram_usage = [3.6, 10.5, 6.8]
-        vram_available = [4.0, 12.0, 8.0]
+        systems = d['systems']
+        vram_usage = d['vram_usage_gb']
+        vram_available = d['vram_available_gb']
         
         x = np.arange(len(systems))
         width = 0.35
@@ -219,83 +342,69 @@ class VisualizationGenerator:
         ax2.set_xticks(x)
         ax2.set_xticklabels(systems)
         ax2.legend(framealpha=0.95)
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        ax2.set_axisbelow(True)
+        self._style_axis(ax2, 'y')
         
         # Add value labels
         for i, (used, total) in enumerate(zip(vram_usage, vram_available)):
-            ax2.text(i - width/2, used + 0.2, f'{used}GB', ha='center', fontsize=8)
-            ax2.text(i + width/2, total + 0.2, f'{total}GB', ha='center', fontsize=8)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'memory_utilization.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'memory_utilization.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: memory_utilization.pdf/png")
+            ax2.text(i - width/2, used + 0.2, f'{used:.1f}GB', ha='center', fontsize=8)
+            ax2.text(i + width/2, total + 0.2, f'{total:.1f}GB', ha='center', fontsize=8)
+        
+        self._save_dual(fig, 'memory_utilization')
     
     def plot_comparative_performance(self):
         """Multi-metric comparison radar chart"""
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        fig, ax = self._new_figure(figsize=(10, 10), subplot_kw=dict(projection='polar'))
         
-        # Metrics (normalized to 0-10 scale)
-        categories = ['Speed\n(Fast Path)', 'Speed\n(Complex)', 'Memory\nEfficiency', 
-                     'Cost\nEfficiency', 'Privacy', 'Accuracy']
+        # Metrics (normalized to 0-10 scale, higher is better)
+        d = self.data['comparative_performance']
+        categories = d['categories']
         
-        # Normalize scores (higher is better)
-        axiom_scores = [9.5, 8.5, 9.0, 10.0, 10.0, 8.2]  # AXIOM
-        openai_scores = [6.0, 4.0, 10.0, 3.0, 3.0, 9.5]  # OpenAI
-        whisper_scores = [3.0, 2.5, 4.0, 8.0, 10.0, 9.0]  # Whisper+GPT-4
-        
-        # Number of variables
+        # One spoke per category; repeat the first point to close each polygon
         N = len(categories)
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]
-        
-        # Close the plot
-        axiom_scores += axiom_scores[:1]
-        openai_scores += openai_scores[:1]
-        whisper_scores += whisper_scores[:1]
+        angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+        angles = np.concatenate([angles, angles[:1]])
+        axiom_scores, openai_scores, whisper_scores = (
+            np.concatenate([scores, scores[:1]])
+            for scores in (d['axiom'], d['openai'], d['whisper_gpt4'])
+        )
         
         # Plot
         ax.plot(angles, axiom_scores, 'o-', linewidth=2, label='AXIOM', 
                color=COLORS['primary'], markersize=8)
-        ax.fill(angles, axiom_scores, alpha=0.25, color=COLORS['primary'])
+        ax.fill(angles, axiom_scores, alpha=0.25, color=COLORS['primary'], rasterized=RASTERIZE_FILLS)
         
         ax.plot(angles, openai_scores, 's-', linewidth=2, label='OpenAI Voice API', 
                color=COLORS['secondary'], markersize=8)
-        ax.fill(angles, openai_scores, alpha=0.25, color=COLORS['secondary'])
+        ax.fill(angles, openai_scores, alpha=0.25, color=COLORS['secondary'], rasterized=RASTERIZE_FILLS)
         
         ax.plot(angles, whisper_scores, '^-', linewidth=2, label='Whisper + GPT-4', 
                color=COLORS['accent'], markersize=8)
-        ax.fill(angles, whisper_scores, alpha=0.25, color=COLORS['accent'])
+        ax.fill(angles, whisper_scores, alpha=0.25, color=COLORS['accent'], rasterized=RASTERIZE_FILLS)
         
         # Fix axis to go in the right order
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(categories, fontsize=10)
         ax.set_ylim(0, 10)
-        ax.set_yticks([2, 4, 6, 8, 10])
-        ax.set_yticklabels(['2', '4', '6', '8', '10'], fontsize=8)
+        ax.set_yticks(self._RADAR_TICKS)
+        ax.set_yticklabels(self._RADAR_TICK_LABELS, fontsize=8)
         ax.grid(True, linestyle='--', alpha=0.5)
         
         ax.set_title('Multi-Dimensional Performance Comparison', 
                     fontweight='bold', pad=20, fontsize=14)
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), framealpha=0.95)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'comparative_performance.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'comparative_performance.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: comparative_performance.pdf/png")
+        self._save_dual(fig, 'comparative_performance')
     
     def plot_accuracy_metrics(self):
         """Accuracy metrics across components"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure(2, 2, figsize=(14, 10))
+        
+        d = self.data['accuracy_metrics']
         
         # 1. Intent Classification Accuracy
-        intents = ['Equipment', 'Projects', 'Lab Info', 'Greetings', 
-                  'Help', 'Status', 'Control', 'Search', 'Other']
-        precision = [0.92, 0.89, 0.91, 0.95, 0.87, 0.88, 0.86, 0.90, 0.84]
-        recall = [0.90, 0.87, 0.89, 0.93, 0.85, 0.86, 0.84, 0.88, 0.82]
+        intents = d['intents']
+        precision = d['precision']
+        recall = d['recall']
         
         x = np.arange(len(intents))
         width = 0.35
@@ -310,21 +419,20 @@ class VisualizationGenerator:
         ax1.set_xticks(x)
         ax1.set_xticklabels(intents, rotation=45, ha='right')
         ax1.legend(framealpha=0.95)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
+        ax1.grid(True, axis='y')
         ax1.set_ylim([0, 1.0])
         ax1.axhline(y=0.88, color='red', linestyle='--', alpha=0.5, label='Threshold')
         
         # 2. STT Word Error Rate
-        test_sets = ['Clean\nSpeech', 'Lab\nNoise', 'Technical\nTerms', 'Accented\nSpeech']
-        wer = [6.5, 8.5, 12.3, 10.8]
+        test_sets = d['stt_test_sets']
+        wer = d['wer']
         
         bars = ax2.bar(test_sets, wer, color=[COLORS['success'], COLORS['primary'], 
                                                COLORS['warning'], COLORS['accent']],
                       edgecolor='black', linewidth=0.5)
         ax2.set_ylabel('Word Error Rate (%)', fontweight='bold')
         ax2.set_title('STT Accuracy (Sherpa-ONNX Parakeet)', fontweight='bold')
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        ax2.set_axisbelow(True)
+        self._style_axis(ax2, 'y')
         
         # Add value labels
         for bar in bars:
@@ -333,17 +441,16 @@ class VisualizationGenerator:
                     f'{height:.1f}%', ha='center', va='bottom', fontsize=9)
         
         # 3. Response Quality Metrics
-        metrics = ['BLEU\nScore', 'Exact\nMatch', 'Semantic\nSimilarity', 'Template\nCoverage']
-        scores = [0.82, 0.94, 0.91, 0.80]
+        metrics = d['quality_metrics']
+        scores = d['quality_scores']
         
         bars = ax3.bar(metrics, scores, color=[COLORS['primary'], COLORS['success'], 
                                                 COLORS['accent'], COLORS['secondary']],
                       edgecolor='black', linewidth=0.5)
         ax3.set_ylabel('Score', fontweight='bold')
         ax3.set_title('Response Quality Metrics', fontweight='bold')
-        ax3.grid(axis='y', alpha=0.3, linestyle='--')
+        self._style_axis(ax3, 'y')
         ax3.set_ylim([0, 1.0])
-        ax3.set_axisbelow(True)
         
         # Add value labels
         for bar in bars:
@@ -352,10 +459,9 @@ class VisualizationGenerator:
                     f'{height:.2f}', ha='center', va='bottom', fontsize=9)
         
         # 4. Overall System Metrics
-        categories = ['Latency\n(Fast)', 'Latency\n(Complex)', 'Intent\nAccuracy', 
-                     'STT\nAccuracy', 'Response\nQuality']
-        axiom = [9.5, 8.0, 8.8, 9.2, 8.5]  # Normalized scores
-        baseline = [6.0, 4.0, 7.5, 8.5, 7.0]
+        categories = d['overall_categories']
+        axiom = d['overall_axiom']  # Normalized scores
+        baseline = d['overall_baseline']
         
         x = np.arange(len(categories))
         width = 0.35
@@ -370,43 +476,40 @@ class VisualizationGenerator:
         ax4.set_xticks(x)
         ax4.set_xticklabels(categories)
         ax4.legend(framealpha=0.95)
-        ax4.grid(axis='y', alpha=0.3, linestyle='--')
+        self._style_axis(ax4, 'y')
         ax4.set_ylim([0, 10])
-        ax4.set_axisbelow(True)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'accuracy_metrics.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'accuracy_metrics.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: accuracy_metrics.pdf/png")
+        self._save_dual(fig, 'accuracy_metrics')
     
     def plot_scalability_analysis(self):
         """Scalability and throughput analysis"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = self._new_figure(1, 2, figsize=(14, 6))
+        
+        d = self.data['scalability_analysis']
         
         # 1. Concurrent users vs latency
-        users = np.array([1, 5, 10, 15, 20, 25, 30])
-        latency_fast = np.array([415, 420, 435, 465, 520, 650, 900])
-        latency_complex = np.array([1155, 1165, 1190, 1240, 1350, 1550, 2100])
+        users = d['users']
+        latency_fast = d['latency_fast']
+        latency_complex = d['latency_complex']
         
         ax1.plot(users, latency_fast, 'o-', linewidth=2, markersize=8,
                 label='Fast Path', color=COLORS['primary'])
         ax1.plot(users, latency_complex, 's-', linewidth=2, markersize=8,
                 label='Complex Path', color=COLORS['secondary'])
         
-        ax1.fill_between(users, latency_fast, alpha=0.2, color=COLORS['primary'])
-        ax1.fill_between(users, latency_complex, alpha=0.2, color=COLORS['secondary'])
+        ax1.fill_between(users, latency_fast, alpha=0.2, color=COLORS['primary'], rasterized=RASTERIZE_FILLS)
+        ax1.fill_between(users, latency_complex, alpha=0.2, color=COLORS['secondary'], rasterized=RASTERIZE_FILLS)
         
         ax1.axvline(x=15, color='red', linestyle='--', alpha=0.5, label='Recommended Max')
         ax1.set_xlabel('Concurrent Users', fontweight='bold')
         ax1.set_ylabel('Latency (milliseconds)', fontweight='bold')
         ax1.set_title('Scalability: Latency vs Concurrent Users', fontweight='bold')
         ax1.legend(framealpha=0.95)
-        ax1.grid(True, alpha=0.3, linestyle='--')
+        ax1.grid(True)
         
         # 2. Throughput (QPS) analysis
-        query_mix = ['100% Fast', '80/20\nMix', '50/50\nMix', '20/80\nMix', '100%\nComplex']
-        qps = [35, 28, 18, 8, 3]
+        query_mix = d['query_mix']
+        qps = d['qps']
         colors_qps = [COLORS['success'], COLORS['primary'], COLORS['accent'], 
                      COLORS['warning'], COLORS['danger']]
         
@@ -414,8 +517,7 @@ class VisualizationGenerator:
         ax2.set_ylabel('Queries Per Second (QPS)', fontweight='bold')
         ax2.set_xlabel('Query Type Distribution', fontweight='bold')
         ax2.set_title('Throughput Capacity (Single GTX 1650)', fontweight='bold')
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        ax2.set_axisbelow(True)
+        self._style_axis(ax2, 'y')
         
         # Add value labels
         for bar in bars:
@@ -423,46 +525,45 @@ class VisualizationGenerator:
             ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
                     f'{int(height)} QPS', ha='center', va='bottom', fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'scalability_analysis.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'scalability_analysis.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: scalability_analysis.pdf/png")
+        self._save_dual(fig, 'scalability_analysis')
     
     def plot_quantization_impact(self):
         """Quantization impact on model size and performance"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure(2, 2, figsize=(14, 10))
+        # Size, speed and accuracy panels share one model axis (ticks set on ax3);
+        # ax1 sits directly above ax3 so its labels are redundant
+        ax1.sharex(ax3)
+        ax2.sharex(ax3)
+        ax1.tick_params(labelbottom=False)
+        
+        d = self.data['quantization_impact']
         
         # 1. Model size comparison
-        models = ['Sherpa-ONNX\nSTT', 'SetFit\nIntent', 'Kokoro\nTTS', 'Ollama\nLLM']
-        fp32_size = [800, 120, 600, 8800]  # MB
-        int8_size = [200, 30, 150, 2200]  # MB
+        models = d['models']
+        fp32_size = d['fp32_size_mb']
+        int8_size = d['int8_size_mb']
         
         x = np.arange(len(models))
         width = 0.35
         
-        ax1.bar(x - width/2, fp32_size, width, label='FP32 (Original)', 
+        fp32_bars = ax1.bar(x - width/2, fp32_size, width, label='FP32 (Original)', 
                color=COLORS['danger'], edgecolor='black', linewidth=0.5)
         ax1.bar(x + width/2, int8_size, width, label='INT8 (Quantized)', 
                color=COLORS['success'], edgecolor='black', linewidth=0.5)
         
         ax1.set_ylabel('Model Size (MB)', fontweight='bold')
         ax1.set_title('Quantization: Model Size Reduction', fontweight='bold')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(models)
         ax1.legend(framealpha=0.95)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
-        ax1.set_axisbelow(True)
+        self._style_axis(ax1, 'y')
         
-        # Add reduction percentages
-        for i, (fp32, int8) in enumerate(zip(fp32_size, int8_size)):
-            reduction = ((fp32 - int8) / fp32) * 100
-            ax1.text(i, max(fp32, int8) + 200, f'-{reduction:.0f}%', 
-                    ha='center', fontsize=9, fontweight='bold', color='green')
+        # Add reduction percentages above the FP32 bars
+        reduction = (fp32_size - int8_size) / fp32_size * 100
+        ax1.bar_label(fp32_bars, labels=[f'-{r:.0f}%' for r in reduction], padding=3,
+                     fontsize=9, fontweight='bold', color='green')
         
         # 2. Inference speed comparison
-        inference_fp32 = [150, 8, 300, 600]  # ms
-        inference_int8 = [100, 5, 200, 400]  # ms
+        inference_fp32 = d['inference_fp32_ms']
+        inference_int8 = d['inference_int8_ms']
         
         ax2.bar(x - width/2, inference_fp32, width, label='FP32', 
                color=COLORS['danger'], edgecolor='black', linewidth=0.5)
@@ -471,19 +572,16 @@ class VisualizationGenerator:
         
         ax2.set_ylabel('Inference Time (ms)', fontweight='bold')
         ax2.set_title('Quantization: Inference Speed Improvement', fontweight='bold')
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(models)
         ax2.legend(framealpha=0.95)
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        ax2.set_axisbelow(True)
+        self._style_axis(ax2, 'y')
         
         # 3. Accuracy retention
-        accuracy_fp32 = [94.5, 89.2, 96.8, 92.3]
-        accuracy_int8 = [93.8, 88.2, 95.9, 91.5]
+        accuracy_fp32 = d['accuracy_fp32']
+        accuracy_int8 = d['accuracy_int8']
         
         ax3.bar(x - width/2, accuracy_fp32, width, label='FP32', 
                color=COLORS['danger'], edgecolor='black', linewidth=0.5)
-        ax3.bar(x + width/2, accuracy_int8, width, label='INT8', 
+        int8_bars = ax3.bar(x + width/2, accuracy_int8, width, label='INT8', 
                color=COLORS['success'], edgecolor='black', linewidth=0.5)
         
         ax3.set_ylabel('Accuracy (%)', fontweight='bold')
@@ -491,27 +589,23 @@ class VisualizationGenerator:
         ax3.set_xticks(x)
         ax3.set_xticklabels(models)
         ax3.legend(framealpha=0.95)
-        ax3.grid(axis='y', alpha=0.3, linestyle='--')
+        self._style_axis(ax3, 'y')
         ax3.set_ylim([80, 100])
-        ax3.set_axisbelow(True)
         
-        # Add accuracy loss
-        for i, (fp32, int8) in enumerate(zip(accuracy_fp32, accuracy_int8)):
-            loss = fp32 - int8
-            ax3.text(i, 82, f'-{loss:.1f}%', ha='center', fontsize=8, color='red')
+        # Add accuracy loss above the INT8 bars
+        loss = accuracy_fp32 - accuracy_int8
+        ax3.bar_label(int8_bars, labels=[f'-{l:.1f}%' for l in loss], padding=3,
+                     fontsize=8, color='red')
         
         # 4. Quality-Size Trade-off Curve
-        sizes = np.array([30, 50, 100, 200, 400, 800, 1600, 3200])  # MB
-        quality_int8 = np.array([82, 85, 88, 91, 93, 94, 94.5, 94.8])
-        quality_int4 = np.array([75, 78, 82, 86, 89, 91, 92, 93])
-        quality_fp16 = np.array([88, 90, 92, 94, 95, 96, 96.5, 97])
-        
-        ax4.plot(sizes, quality_int8, 'o-', linewidth=2, markersize=6,
-                label='INT8 Quantization', color=COLORS['success'])
-        ax4.plot(sizes, quality_int4, 's-', linewidth=2, markersize=6,
-                label='INT4 Quantization', color=COLORS['warning'])
-        ax4.plot(sizes, quality_fp16, '^-', linewidth=2, markersize=6,
-                label='FP16 (Half Precision)', color=COLORS['primary'])
+        sizes = d['tradeoff_sizes_mb']
+        quality = np.column_stack((d['quality_int8'], d['quality_int4'], d['quality_fp16']))
+        
+        # One plot call over the (size x precision) matrix, then per-curve styling
+        curves = ax4.plot(sizes, quality, linewidth=2, markersize=6,
+                          label=self._TRADEOFF_LABELS)
+        for curve, marker, color in zip(curves, 'os^', (COLORS['success'], COLORS['warning'], COLORS['primary'])):
+            curve.set(marker=marker, color=color)
         
         ax4.axvline(x=200, color='red', linestyle='--', alpha=0.5, label='AXIOM Choice')
         ax4.set_xlabel('Model Size (MB)', fontweight='bold')
@@ -519,22 +613,19 @@ class VisualizationGenerator:
         ax4.set_title('Quality-Size Trade-off Curves', fontweight='bold')
         ax4.set_xscale('log')
         ax4.legend(framealpha=0.95, loc='lower right')
-        ax4.grid(True, alpha=0.3, linestyle='--', which='both')
+        ax4.grid(True, which='both')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'quantization_impact.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'quantization_impact.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: quantization_impact.pdf/png")
+        self._save_dual(fig, 'quantization_impact')
     
     def plot_template_bypass_efficiency(self):
         """Template bypass strategy efficiency"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure(2, 2, figsize=(14, 10))
+        
+        d = self.data['template_bypass_efficiency']
         
         # 1. Query distribution
-        query_types = ['Equipment\nSpecs', 'Lab\nInfo', 'Project\nIdeas', 
-                      'Greetings', 'Complex\nQueries', 'Other']
-        template_hit = [95, 90, 85, 98, 15, 70]  # % hit rate
+        query_types = d['query_types']
+        template_hit = d['template_hit']  # % hit rate
         
         colors = [COLORS['success'] if x >= 80 else COLORS['warning'] if x >= 50 
                  else COLORS['danger'] for x in template_hit]
@@ -545,7 +636,7 @@ class VisualizationGenerator:
         ax1.set_ylabel('Template Hit Rate (%)', fontweight='bold')
         ax1.set_title('Template Bypass Efficiency by Query Type', fontweight='bold')
         ax1.legend(framealpha=0.95)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
+        ax1.grid(True, axis='y')
         ax1.set_ylim([0, 100])
         
         # Add value labels
@@ -555,9 +646,9 @@ class VisualizationGenerator:
                     f'{int(height)}%', ha='center', va='bottom', fontsize=9)
         
         # 2. Latency comparison: Template vs LLM
-        scenarios = ['Simple\nQuery', 'Medium\nQuery', 'Complex\nQuery']
-        template_latency = [0.0001, 0.0001, 0.0001]  # ms
-        llm_latency = [400, 500, 650]  # ms
+        scenarios = d['scenarios']
+        template_latency = d['template_latency_ms']
+        llm_latency = d['llm_latency_ms']
         
         x = np.arange(len(scenarios))
         width = 0.35
@@ -575,41 +666,41 @@ class VisualizationGenerator:
         ax2.set_xticklabels(scenarios)
         ax2.set_yscale('log')
         ax2.legend(framealpha=0.95)
-        ax2.grid(True, alpha=0.3, linestyle='--', which='both')
+        ax2.grid(True, which='both')
         
         # 3. Cost savings over time
         hours = np.arange(0, 25, 1)
         queries_per_hour = 100
         
-        # Cost calculation (assuming $0.002 per LLM call)
-        cost_no_template = hours * queries_per_hour * 0.002
-        cost_with_template = hours * queries_per_hour * 0.20 * 0.002  # 20% use LLM
-        savings = cost_no_template - cost_with_template
+        # Cost calculation (assuming $0.002 per LLM call); fold the scalars first
+        # so each curve is a single array op
+        cost_no_template = hours * (queries_per_hour * 0.002)
+        cost_with_template = cost_no_template * 0.20  # 20% use LLM
         
         ax3.plot(hours, cost_no_template, linewidth=2, label='Without Template Bypass',
                 color=COLORS['danger'])
         ax3.plot(hours, cost_with_template, linewidth=2, label='With Template Bypass (80% hit)',
                 color=COLORS['success'])
         ax3.fill_between(hours, cost_with_template, cost_no_template, 
-                        alpha=0.3, color=COLORS['success'], label='Savings')
+                        alpha=0.3, color=COLORS['success'], label='Savings',
+                        rasterized=RASTERIZE_FILLS)
         
         ax3.set_xlabel('Operating Hours', fontweight='bold')
         ax3.set_ylabel('Cumulative Cost ($)', fontweight='bold')
         ax3.set_title('Cost Savings: Template Bypass Strategy', fontweight='bold')
         ax3.legend(framealpha=0.95)
-        ax3.grid(True, alpha=0.3, linestyle='--')
+        ax3.grid(True)
         
         # 4. Template database coverage
-        categories = ['Equipment\n(27 items)', 'Technical\nFacts\n(1,806)', 
-                     'Projects\n(325)', 'Templates\n(2,116)']
-        coverage = [100, 92, 88, 80]
+        categories = d['kb_categories']
+        coverage = d['kb_coverage']
         
         bars = ax4.barh(categories, coverage, color=[COLORS['primary'], COLORS['accent'],
                                                       COLORS['success'], COLORS['secondary']],
                        edgecolor='black', linewidth=0.5)
         ax4.set_xlabel('Coverage (%)', fontweight='bold')
         ax4.set_title('Knowledge Base Coverage', fontweight='bold')
-        ax4.grid(axis='x', alpha=0.3, linestyle='--')
+        ax4.grid(True, axis='x')
         ax4.set_xlim([0, 100])
         
         # Add value labels
@@ -618,20 +709,37 @@ class VisualizationGenerator:
             ax4.text(width + 1, bar.get_y() + bar.get_height()/2.,
                     f'{int(width)}%', ha='left', va='center', fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'template_bypass_efficiency.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'template_bypass_efficiency.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: template_bypass_efficiency.pdf/png")
+        self._save_dual(fig, 'template_bypass_efficiency')
     
     def plot_zero_copy_benefits(self):
         """Zero-copy inference benefits visualization"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        d = self.data['zero_copy_benefits']
+        
+        # All numeric prep for the four panels up front; the plotting below only draws
+        traditional_mb_per_call = 8.5 * 3  # 8.5MB audio buffer, 3 copies per inference
+        zero_copy_mb_per_call = 0.5  # Minimal overhead
+        model_overhead_mb = 150
+        vram_available = 4000  # MB (GTX 1650)
+        
+        # Cumulative overhead: constant cost per call, so the running total is
+        # the closed form n * cost (no cumsum pass needed)
+        inferences = np.arange(1, 101)
+        traditional_cumulative = inferences * traditional_mb_per_call
+        zero_copy_cumulative = inferences * zero_copy_mb_per_call
+        
+        # Capacity: traditional 8.5MB * 3 copies = 25.5MB per user; zero-copy 0.5MB per user.
+        # Both clipped curves in one broadcast (strategy x users)
+        users = np.arange(1, 51)
+        capacity = vram_available / (np.array([traditional_mb_per_call, zero_copy_mb_per_call]) + model_overhead_mb)
+        traditional_capacity, zero_copy_capacity = capacity
+        traditional_users, zero_copy_users = np.minimum(users, capacity[:, None])
+        
+        fig, ((ax1, ax2), (ax3, ax4)) = self._new_figure(2, 2, figsize=(14, 10))
         
         # 1. Memory allocation comparison
-        stages = ['Audio\nCapture', 'STT\nInput', 'Token\nConversion', 'GPU\nTransfer']
-        traditional = [8.5, 8.5, 8.5, 8.5]  # MB per stage (cumulative copies)
-        zero_copy = [8.5, 0, 0, 0]  # MB (no copies)
+        stages = d['stages']
+        traditional = d['traditional_mb']  # MB per stage (cumulative copies)
+        zero_copy = d['zero_copy_mb']  # MB (no copies)
         
         x = np.arange(len(stages))
         width = 0.35
@@ -646,14 +754,9 @@ class VisualizationGenerator:
         ax1.set_xticks(x)
         ax1.set_xticklabels(stages)
         ax1.legend(framealpha=0.95)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
-        ax1.set_axisbelow(True)
+        self._style_axis(ax1, 'y')
         
         # 2. Cumulative memory overhead
-        inferences = np.arange(1, 101)
-        traditional_cumulative = inferences * 8.5 * 3  # 3 copies per inference
-        zero_copy_cumulative = inferences * 0.5  # Minimal overhead
-        
         ax2.plot(inferences, traditional_cumulative, linewidth=2, 
                 label='Traditional', color=COLORS['danger'])
         ax2.plot(inferences, zero_copy_cumulative, linewidth=2, 
@@ -665,7 +768,7 @@ class VisualizationGenerator:
         ax2.set_ylabel('Cumulative Memory Overhead (MB)', fontweight='bold')
         ax2.set_title('Memory Overhead Accumulation', fontweight='bold')
         ax2.legend(framealpha=0.95)
-        ax2.grid(True, alpha=0.3, linestyle='--')
+        ax2.grid(True)
         
         # Add annotation for 94% reduction
         ax2.annotate('94% Reduction', xy=(50, traditional_cumulative[49]), 
@@ -673,10 +776,9 @@ class VisualizationGenerator:
                     arrowprops=dict(arrowstyle='->', color='green', lw=2))
         
         # 3. Latency improvement
-        operations = ['Memory\nAllocation', 'Data\nCopy', 'Pointer\nAssignment', 
-                     'Total\nOverhead']
-        traditional_time = [2.5, 5.8, 0.1, 8.4]  # ms
-        zero_copy_time = [0.1, 0, 0.1, 0.2]  # ms
+        operations = d['operations']
+        traditional_time = d['traditional_time_ms']
+        zero_copy_time = d['zero_copy_time_ms']
         
         x = np.arange(len(operations))
         width = 0.35
@@ -691,21 +793,9 @@ class VisualizationGenerator:
         ax3.set_xticks(x)
         ax3.set_xticklabels(operations)
         ax3.legend(framealpha=0.95)
-        ax3.grid(axis='y', alpha=0.3, linestyle='--')
-        ax3.set_axisbelow(True)
+        self._style_axis(ax3, 'y')
         
         # 4. Concurrent user capacity
-        vram_available = 4000  # MB (GTX 1650)
-        users = np.arange(1, 51)
-        
-        # Traditional: 8.5MB * 3 copies = 25.5MB per user
-        traditional_capacity = vram_available / (25.5 + 150)  # + model overhead
-        # Zero-copy: 0.5MB per user
-        zero_copy_capacity = vram_available / (0.5 + 150)  # + model overhead
-        
-        traditional_users = np.minimum(users, traditional_capacity)
-        zero_copy_users = np.minimum(users, zero_copy_capacity)
-        
         ax4.fill_between(users, 0, traditional_users, alpha=0.5, 
                         color=COLORS['danger'], label='Traditional (Max ~22 users)')
         ax4.fill_between(users, 0, zero_copy_users, alpha=0.5, 
@@ -720,45 +810,55 @@ class VisualizationGenerator:
         ax4.set_ylabel('Supported Users', fontweight='bold')
         ax4.set_title('Concurrent User Capacity (GTX 1650 4GB)', fontweight='bold')
         ax4.legend(framealpha=0.95, loc='lower right')
-        ax4.grid(True, alpha=0.3, linestyle='--')
+        ax4.grid(True)
         ax4.set_xlim([0, 50])
         ax4.set_ylim([0, 30])
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'zero_copy_benefits.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'zero_copy_benefits.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: zero_copy_benefits.pdf/png")
+        self._save_dual(fig, 'zero_copy_benefits')
     
     def plot_intent_confusion_matrix(self):
         """Intent classification confusion matrix"""
-        fig, ax = plt.subplots(figsize=(12, 10))
+        fig, ax = self._new_figure(figsize=(12, 10))
+        
+        d = self.data['intent_confusion_matrix']
         
         # Intent classes
-        intents = ['Equipment', 'Projects', 'Lab Info', 'Greetings', 
-                  'Help', 'Status', 'Control', 'Search', 'Other']
+        intents = d['intents']
         
         # Simulated confusion matrix (9x9)
-        np.random.seed(42)
-        confusion = np.zeros((9, 9))
+        n = len(intents)
+        confusion = np.empty((n, n))
         
         # Diagonal (correct predictions) - high values
-        np.fill_diagonal(confusion, [92, 89, 91, 95, 87, 88, 86, 90, 84])
+        np.fill_diagonal(confusion, d['diagonal'])
         
-        # Off-diagonal (misclassifications) - low values
-        for i in range(9):
-            for j in range(9):
-                if i != j:
-                    confusion[i, j] = np.random.randint(0, 5)
+        # Off-diagonal (misclassifications) - low values, drawn in one call
+        rng = np.random.default_rng(42)
+        confusion[~np.eye(n, dtype=bool)] = rng.integers(0, 5, size=n * (n - 1))
         
         # Normalize to percentages
-        confusion = confusion / confusion.sum(axis=1, keepdims=True) * 100
-        
-        # Create heatmap
-        sns.heatmap(confusion, annot=True, fmt='.1f', cmap='YlGnBu', 
-                   xticklabels=intents, yticklabels=intents, 
-                   cbar_kws={'label': 'Percentage (%)'}, ax=ax,
-                   linewidths=0.5, linecolor='gray')
+        confusion *= 100.0 / confusion.sum(axis=1, keepdims=True)
+        
+        # Create heatmap: one QuadMesh with gray cell borders (seaborn.heatmap's
+        # look without its DataFrame wrapping), rows top-down
+        mesh = ax.pcolormesh(confusion, cmap='YlGnBu', edgecolors='gray', linewidth=0.5)
+        ax.set(xlim=(0, n), ylim=(n, 0))
+        ax.set_xticks(np.arange(n) + 0.5, intents)
+        ax.set_yticks(np.arange(n) + 0.5, intents)
+        ax.tick_params(length=0)
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+        
+        colorbar = fig.colorbar(mesh, ax=ax, label='Percentage (%)')
+        colorbar.outline.set_visible(False)
+        
+        # Cell annotations, dark text on light cells and vice versa
+        rgb = mesh.to_rgba(confusion)[..., :3]
+        linear_rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        luminance = linear_rgb @ np.array([0.2126, 0.7152, 0.0722])
+        for (i, j), value in np.ndenumerate(confusion):
+            ax.text(j + 0.5, i + 0.5, f'{value:.1f}', ha='center', va='center',
+                    color='black' if luminance[i, j] > 0.408 else 'white')
         
         ax.set_xlabel('Predicted Intent', fontweight='bold', fontsize=12)
         ax.set_ylabel('True Intent', fontweight='bold', fontsize=12)
@@ -766,18 +866,22 @@ class VisualizationGenerator:
                     fontweight='bold', fontsize=14, pad=15)
         
         # Rotate labels
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-        plt.setp(ax.get_yticklabels(), rotation=0)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'intent_confusion_matrix.pdf', bbox_inches='tight')
-        plt.savefig(self.output_dir / 'intent_confusion_matrix.png', bbox_inches='tight')
-        plt.close()
-        print("✓ Generated: intent_confusion_matrix.pdf/png")
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+        setp(ax.get_yticklabels(), rotation=0)
+        
+        self._save_dual(fig, 'intent_confusion_matrix')
 
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="AXIOM research paper figure generator")
+    parser.add_argument("--formats", type=_parse_formats, default=FIGURE_FORMATS,
+                        help="Comma-separated output formats, e.g. 'png' to skip PDFs "
+                             "(default: $AXIOM_FIGURE_FORMATS or 'pdf,png')")
+    parser.add_argument("--release", action="store_true",
+                        help="Maximum PNG compression for the final paper build (slower)")
+    args = parser.parse_args()
+    
     print("="*60)
     print("AXIOM Research Paper - Visualization Generator")
     print("="*60)
@@ -787,7 +891,8 @@ def main():
     output_dir = Path(__file__).parent / "paper_figures"
     
     # Generate visualizations
-    generator = VisualizationGenerator(output_dir=str(output_dir))
+    generator = VisualizationGenerator(output_dir=str(output_dir), release=args.release,
+                                       formats=args.formats)
     generator.generate_all()
     
     print()
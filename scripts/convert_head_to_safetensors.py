@@ -1,34 +1,66 @@
+import argparse
 import os
-import joblib
 import torch
 import numpy as np
 from safetensors.torch import save_file
 from pathlib import Path
 
-def convert_head():
+WEIGHT_DTYPES = ("fp32", "bf16", "int8")
+
+def _pack_weights(weights, dtype):
+    """
+    Head weight tensors for the requested storage dtype. int8 is symmetric
+    per-class (per-row) quantization plus a float32 ``weight_scale``; the loader
+    (backend/intent_classifier.py) dequantizes both bf16 and int8 back to
+    float32 once at load time.
+    """
+    weights = weights.astype(np.float32)
+    if dtype == "bf16":
+        return {"weights": torch.from_numpy(weights).to(torch.bfloat16)}
+    if dtype == "int8":
+        scale = np.abs(weights).max(axis=1) / 127
+        scale[scale == 0] = 1.0  # All-zero row: any scale round-trips
+        quantized = np.round(weights / scale[:, None]).astype(np.int8)
+        return {"weights": torch.from_numpy(quantized), "weight_scale": torch.from_numpy(scale)}
+    return {"weights": torch.from_numpy(weights)}
+
+def convert_head(dtype="fp32"):
     # Paths
     model_dir = Path("models/intent_model/setfit_intent_classifier")
     input_path = model_dir / "model_head.pkl"
     output_path = model_dir / "model_head.safetensors"
     
+    # Plain-array copy of the head params, so reruns skip sklearn + unpickling
+    cache_path = input_path.with_suffix(".npz")
+    
     if not input_path.exists():
         print(f"❌ Error: {input_path} not found.")
         return
 
-    print(f"📂 Loading legacy head from {input_path}")
-    try:
-        model = joblib.load(input_path)
-    except Exception as e:
-        print(f"❌ Failed to load pickle: {e}")
-        return
+    if cache_path.exists() and cache_path.stat().st_mtime >= input_path.stat().st_mtime:
+        print(f"📂 Loading cached head params from {cache_path}")
+        with np.load(cache_path) as cached:
+            weights, intercept, classes = cached["coef"], cached["intercept"], cached["classes"]
+    else:
+        print(f"📂 Loading legacy head from {input_path}")
+        try:
+            import joblib
+            model = joblib.load(input_path)
+        except Exception as e:
+            print(f"❌ Failed to load pickle: {e}")
+            return
 
-    # Extract LogisticRegression parameters
-    # coef_ shape: (n_classes, n_features)
-    # intercept_ shape: (n_classes,)
-    
-    weights = model.coef_
-    intercept = model.intercept_
-    classes = model.classes_
+        # Extract LogisticRegression parameters
+        # coef_ shape: (n_classes, n_features)
+        # intercept_ shape: (n_classes,)
+        
+        weights = model.coef_
+        intercept = model.intercept_
+        classes = np.asarray(model.classes_)
+        if classes.dtype.kind == 'O':
+            classes = classes.astype(str)  # Keep the cache loadable without allow_pickle
+        
+        np.savez(cache_path, coef=weights, intercept=intercept, classes=classes)
     
     print(f"📊 Extracted Model Params:")
     print(f"   - Weights shape: {weights.shape}")
@@ -37,15 +69,18 @@ def convert_head():
 
     # Convert to tensors
     tensors = {
-        "weights": torch.from_numpy(weights.astype(np.float32)),
+        **_pack_weights(weights, dtype),
         "intercept": torch.from_numpy(intercept.astype(np.float32)),
         # Classes are usually integers or strings, safetensors prefers numeric
         "classes": torch.tensor(classes.astype(np.int64)) if classes.dtype.kind in 'iu' else torch.arange(len(classes))
     }
 
-    print(f"💾 Saving to {output_path}")
+    print(f"💾 Saving to {output_path} (weights: {dtype})")
     save_file(tensors, output_path)
     print("✅ Conversion complete!")
 
 if __name__ == "__main__":
-    convert_head()
+    parser = argparse.ArgumentParser(description="Convert the SetFit pickle head to safetensors")
+    parser.add_argument("--dtype", choices=WEIGHT_DTYPES, default="fp32",
+                        help="Storage dtype for the head weights (bf16 halves, int8 quarters the file)")
+    convert_head(parser.parse_args().dtype)
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+def convert_vad():
+    # Paths
+    input_path = Path("models/silero_vad.onnx")
+    output_path = Path("models/silero_vad.fp16.onnx")
+
+    if not input_path.exists():
+        print(f"❌ Error: {input_path} not found.")
+        return
+
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError as e:
+        print(f"❌ Missing dependency ({e.name}): pip install onnx onnxconverter-common")
+        return
+
+    print(f"📂 Loading FP32 VAD from {input_path}")
+    model = onnx.load(str(input_path))
+
+    # keep_io_types: weights/activations go FP16, but audio, h/c state and the
+    # speech probability stay float32, so callers feed the same arrays as before
+    model_fp16 = float16.convert_float_to_float16(model, keep_io_types=True)
+
+    print(f"💾 Saving to {output_path}")
+    onnx.save(model_fp16, str(output_path))
+    print("✅ Conversion complete! Used automatically by benchmarks/latency_benchmark.py on GPU EPs.")
+
+if __name__ == "__main__":
+    convert_vad()
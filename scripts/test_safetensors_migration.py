@@ -33,8 +33,7 @@ def test_migration():
     ]
     
     print("\nRunning Inference tests:")
-    for query in test_queries:
-        result = classifier.predict(query)
+    for query, result in zip(test_queries, classifier.predict_batch(test_queries)):
         print(f"🔍 Q: '{query}'")
         print(f"   -> Intent: {result['intent']} (Confidence: {result['confidence']:.4f})")
     
@@ -4,11 +4,13 @@
 Demonstrates FIFO context management and natural multi-turn dialogue.
 
 Run from: /home/user/Desktop/voice\ agent/suvidha/special_features
-python test_glued_interactions.py
+python test_glued_interactions.py   (or: pytest test_glued_interactions.py)
 """
 
 import sys
 import os
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 # Add backend to path
@@ -20,71 +22,126 @@ import json
 import time
 from datetime import datetime
 
+import pytest
 
-def print_header(title):
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+# Pause between printed turns for live demos (DEMO_MODE=1); CI runs without sleeps
+DEMO_MODE = bool(os.environ.get("DEMO_MODE"))
 
 
-def print_interaction(num, user_query, intent, confidence, response, context_count=0):
-    print(f"\n[Interaction {num}]")
-    print(f"  👤 User: \"{user_query}\"")
-    print(f"  🎯 Intent: {intent} (confidence: {confidence:.2f})")
-    if context_count > 0:
-        print(f"  📖 Context Injected: {context_count} previous interactions included")
-    print(f"  🤖 AXIOM: \"{response[:80]}...\"" if len(response) > 80 else f"  🤖 AXIOM: \"{response}\"")
-    time.sleep(0.3)
+@pytest.fixture
+def manager(request):
+    """Isolated in-memory manager per test, connection closed afterwards.
+    Parametrize indirectly to set pin_first_k (default 0)."""
+    pin_first_k = getattr(request, "param", 0)
+    fresh = ConversationManager(max_history=5, db_path=":memory:", pin_first_k=pin_first_k)
+    yield fresh
+    fresh.database.close()
 
 
-def test_fifo_behavior():
-    """Test that FIFO queue maintains exactly 5 interactions"""
-    print_header("TEST 1: FIFO Queue Behavior (Max 5)")
-    
-    manager = ConversationManager(max_history=5, db_path=":memory:")
-    
-    # Simulate 7 interactions
-    test_data = [
-        ("what is jetson orin", "equipment_query", 0.92, "Jetson Orin is an edge AI computer"),
-        ("does it support cameras", "follow_up", 0.88, "Yes, supports RealSense D435i"),
-        ("how much vram", "spec_query", 0.85, "Orin NX has 8GB, Orin has 12GB LPDDR5X"),
-        ("what about power", "spec_query", 0.90, "Jetson Orin: 15W-25W TDP"),
-        ("can i use for robotics", "use_case", 0.87, "Perfect for robotics applications"),
-        ("what is the cost", "pricing", 0.91, "Jetson Orin ranges from $199-$499"),
-        ("does it have wifi", "connectivity", 0.89, "Yes, built-in WiFi 6E and Bluetooth"),
-    ]
-    
-    for i, (query, intent, conf, response) in enumerate(test_data, 1):
-        manager.add_interaction(query, intent, response, conf)
-        history_size = len(manager.history)
-        
-        print(f"\n✏️  Added interaction {i}")
-        print(f"   History size: {history_size}/5", end="")
-        
-        if i <= 5:
-            print(f" ✅ (growing)")
-        elif i > 5:
-            print(f" ✅ (FIFO: oldest removed)")
-    
-    # Verify final state
-    print("\n" + "-" * 70)
-    print("✅ FINAL HISTORY (last 5 interactions):")
-    for i, interaction in enumerate(manager.history, 1):
-        print(f"   {i}. {interaction['intent']}: \"{interaction['user_query'][:40]}...\"")
+class Printer:
+    """
+    Collects a test's report lines and writes them with one stdout write.
+    Live (write-through) in DEMO_MODE so the demo pacing is still visible.
+    """
+    
+    def __init__(self, live=DEMO_MODE):
+        self.live = live
+        self.buf = []
+    
+    def line(self, text=""):
+        if self.live:
+            print(text)
+        else:
+            self.buf.append(text)
     
-    if len(manager.history) == 5:
-        print("\n✅ FIFO WORKING CORRECTLY: Exactly 5 interactions maintained")
-        return True
-    else:
-        print(f"\n❌ FIFO ERROR: Expected 5, got {len(manager.history)}")
-        return False
+    def flush(self):
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            self.buf.clear()
+
+
+def print_header(title, out):
+    out.line("\n" + "=" * 70)
+    out.line(f"  {title}")
+    out.line("=" * 70)
 
 
-def test_context_injection():
+def print_interaction(out, num, user_query, intent, confidence, response, context_count=0):
+    out.line(f"\n[Interaction {num}]")
+    out.line(f"  👤 User: \"{user_query}\"")
+    out.line(f"  🎯 Intent: {intent} (confidence: {confidence:.2f})")
+    if context_count > 0:
+        out.line(f"  📖 Context Injected: {context_count} previous interactions included")
+    short = response if len(response) <= 80 else response[:80] + "..."
+    out.line(f"  🤖 AXIOM: \"{short}\"")
+    if DEMO_MODE:
+        time.sleep(0.3)
+
+
+# Insert counts for the FIFO invariant: at, just over and far past max_history
+FIFO_INSERT_COUNTS = [5, 7, 20, 200]
+
+
+@pytest.mark.parametrize("n_insert", FIFO_INSERT_COUNTS)
+def test_fifo_invariant(manager, n_insert):
+    """Test that the FIFO keeps exactly the newest min(N, 5) interactions"""
+    out = Printer()
+    print_header(f"TEST 1: FIFO Invariant ({n_insert} inserts, Max 5)", out)
+    
+    manager.add_interactions_bulk([
+        (f"query number {i}", "test_intent", f"response to query {i}", 0.85)
+        for i in range(n_insert)
+    ])
+    
+    kept = [interaction.user_query for interaction in manager.history]
+    out.line(f"\n✏️  Added {n_insert} interactions in one batch")
+    out.line(f"   History size: {len(kept)}/5 (FIFO: oldest {n_insert - len(kept)} removed)")
+    for query in kept:
+        out.line(f"   In memory: {query}")
+    
+    # Only the newest 5 should survive, in insertion order
+    out.line("\n" + "-" * 70)
+    expected = [f"query number {i}" for i in range(max(n_insert - 5, 0), n_insert)]
+    
+    passed = len(kept) == min(n_insert, 5) and kept == expected
+    if passed:
+        out.line(f"\n✅ FIFO WORKING CORRECTLY: Last {len(expected)} interactions kept")
+    out.flush()
+    assert passed, f"FIFO ERROR: Expected {expected}, got {kept}"
+
+
+@pytest.mark.parametrize("manager", [1], indirect=True)
+def test_attention_sink_retention(manager):
+    """Test that a pinned opening interaction survives FIFO eviction"""
+    out = Printer()
+    print_header("TEST 2: Attention-Sink Retention (Pin First 1, Max 5)", out)
+    
+    manager.add_interactions_bulk([
+        (f"query number {i}", "test_intent", f"response to query {i}", 0.85)
+        for i in range(20)
+    ])
+    
+    kept = [interaction.user_query for interaction in manager.history]
+    context = manager.get_context_for_llm(count=3)
+    for query in kept:
+        out.line(f"   In memory: {query}")
+    out.line("\n" + "-" * 70)
+    out.line(context)
+    
+    # Interaction #1 is pinned; the other 4 slots hold the newest turns
+    expected = ["query number 0"] + [f"query number {i}" for i in range(16, 20)]
+    
+    passed = kept == expected and "query number 0" in context and "query number 19" in context
+    if passed:
+        out.line("\n✅ ATTENTION SINK WORKING: First interaction kept alongside the newest 4")
+    out.flush()
+    assert passed, f"SINK ERROR: Expected {expected}, got {kept}"
+
+
+def test_context_injection(manager):
     """Test that context is properly formatted for LLM"""
-    print_header("TEST 2: Context Injection for LLM")
-    
-    manager = ConversationManager(max_history=5, db_path=":memory:")
+    out = Printer()
+    print_header("TEST 3: Context Injection for LLM", out)
     
     # Add interactions
     interactions = [
@@ -95,34 +152,33 @@ def test_context_injection():
         ("can I buy one", "pricing", 0.85, "Available from online retailers"),
     ]
     
-    print("\n📝 Adding interactions to history...")
+    out.line("\n📝 Adding interactions to history...")
     for i, (query, intent, conf, response) in enumerate(interactions, 1):
         manager.add_interaction(query, intent, response, conf)
-        print(f"   {i}. {query[:40]}...")
-        time.sleep(0.1)
+        out.line(f"   {i}. {query[:40]}...")
+        if DEMO_MODE:
+            time.sleep(0.1)
     
     # Get context for LLM
     context = manager.get_context_for_llm(count=4)
     
-    print("\n" + "-" * 70)
-    print("🧠 CONTEXT FORMATTED FOR LLM (last 4 interactions):")
-    print("-" * 70)
-    print(context)
-    
-    # Verify context contains references to previous interactions
-    if "unitree go2" in context.lower() and "stairs" in context.lower():
-        print("\n✅ CONTEXT INJECTION WORKING: LLM can reference previous topics")
-        return True
-    else:
-        print("\n❌ CONTEXT ERROR: Missing references to previous interactions")
-        return False
+    out.line("\n" + "-" * 70)
+    out.line("🧠 CONTEXT FORMATTED FOR LLM (last 4 interactions):")
+    out.line("-" * 70)
+    out.line(context)
+    
+    # Verify context carries the last 4 turns (the first one is outside the window)
+    passed = all(query in context for query, _, _, _ in interactions[-4:])
+    if passed:
+        out.line("\n✅ CONTEXT INJECTION WORKING: LLM can reference previous topics")
+    out.flush()
+    assert passed, "CONTEXT ERROR: Missing references to previous interactions"
 
 
-def test_multi_turn_dialogue():
+def test_multi_turn_dialogue(manager):
     """Test natural multi-turn conversation flow"""
-    print_header("TEST 3: Multi-Turn Dialogue Simulation")
-    
-    manager = ConversationManager(max_history=5, db_path=":memory:")
+    out = Printer()
+    print_header("TEST 4: Multi-Turn Dialogue Simulation", out)
     
     dialogue_flow = [
         {
@@ -162,7 +218,7 @@ def test_multi_turn_dialogue():
         },
     ]
     
-    print("\n🎭 Simulating natural conversation flow...\n")
+    out.line("\n🎭 Simulating natural conversation flow...\n")
     
     for i, turn in enumerate(dialogue_flow, 1):
         # Get context if needed
@@ -173,6 +229,7 @@ def test_multi_turn_dialogue():
         
         # Display interaction
         print_interaction(
+            out,
             i,
             turn["user"],
             turn["intent"],
@@ -189,18 +246,18 @@ def test_multi_turn_dialogue():
             turn["confidence"]
         )
     
-    print("\n" + "-" * 70)
-    if len(manager.history) == 5:
-        print("✅ MULTI-TURN DIALOGUE WORKING: Natural conversation maintained")
-        return True
-    else:
-        print("❌ ERROR: History not maintained properly")
-        return False
+    out.line("\n" + "-" * 70)
+    passed = len(manager.history) == 5
+    if passed:
+        out.line("✅ MULTI-TURN DIALOGUE WORKING: Natural conversation maintained")
+    out.flush()
+    assert passed, "ERROR: History not maintained properly"
 
 
 def test_database_persistence():
     """Test that interactions are stored in SQLite"""
-    print_header("TEST 4: Database Persistence")
+    out = Printer()
+    print_header("TEST 5: Database Persistence", out)
     
     db_path = "/tmp/test_glued_interactions.db"
     if os.path.exists(db_path):
@@ -208,114 +265,36 @@ def test_database_persistence():
     
     manager = ConversationManager(max_history=5, db_path=db_path)
     
-    print("\n💾 Writing 3 interactions to database...")
+    out.line("\n💾 Writing 3 interactions to database...")
     test_queries = [
         ("what is setfit", "ml_question", 0.90, "SetFit is a few-shot learning framework"),
         ("how does it work", "follow_up", 0.85, "It trains on small labeled datasets"),
         ("can i fine tune it", "technical_query", 0.88, "Yes, SetFit supports fine-tuning"),
     ]
     
+    manager.add_interactions_bulk([(query, intent, response, conf) for query, intent, conf, response in test_queries])
     for query, intent, conf, response in test_queries:
-        manager.add_interaction(query, intent, response, conf)
-        print(f"   ✓ {intent}")
+        out.line(f"   ✓ {intent}")
     
     # Read back from database
-    print("\n📖 Reading from database...")
-    import sqlite3
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT user_query, intent, response, confidence FROM interaction_history ORDER BY id")
-    rows = cursor.fetchall()
-    conn.close()
+    out.line("\n📖 Reading from database...")
+    with closing(sqlite3.connect(db_path)) as conn:
+        rows = conn.execute("SELECT user_query, intent, response, confidence FROM interactions ORDER BY id").fetchall()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    manager.database.close()
     
-    print(f"\n   Found {len(rows)} records in database:")
+    out.line(f"\n   Found {len(rows)} records in database:")
     for i, (query, intent, response, conf) in enumerate(rows, 1):
-        print(f"   {i}. [{intent}] {query[:40]}...")
+        out.line(f"   {i}. [{intent}] {query[:40]}...")
+    out.line(f"   Journal mode: {journal_mode}")
     
-    if len(rows) == 3:
-        print("\n✅ DATABASE PERSISTENCE WORKING: Data correctly stored")
+    passed = len(rows) == 3 and journal_mode == "wal"
+    if passed:
+        out.line("\n✅ DATABASE PERSISTENCE WORKING: Data correctly stored (WAL)")
         os.remove(db_path)
-        return True
-    else:
-        print(f"\n❌ DATABASE ERROR: Expected 3, got {len(rows)}")
-        return False
-
-
-def test_no_memory_leaks():
-    """Test that old interactions are properly removed"""
-    print_header("TEST 5: Memory Management (No Leaks)")
-    
-    manager = ConversationManager(max_history=5, db_path=":memory:")
-    
-    print("\n🧠 Adding 20 interactions (only last 5 kept in memory)...\n")
-    
-    memory_usage = []
-    for i in range(20):
-        manager.add_interaction(
-            f"query number {i}",
-            "test_intent",
-            f"response to query {i}",
-            0.85
-        )
-        
-        history_size = len(manager.history)
-        memory_usage.append(history_size)
-        
-        if i < 5:
-            print(f"   Interaction {i+1:2d}: {history_size} in memory (growing)")
-        elif i == 5:
-            print(f"   Interaction {i+1:2d}: {history_size} in memory (→ FIFO active)")
-        else:
-            print(f"   Interaction {i+1:2d}: {history_size} in memory (← Old removed)")
-    
-    # Check memory stayed constant after initial growth
-    print("\n" + "-" * 70)
-    print("Memory Trace:", memory_usage)
-    
-    if all(size == 5 for size in memory_usage[5:]):
-        print("\n✅ NO MEMORY LEAKS: Size stayed constant at 5")
-        return True
-    else:
-        print(f"\n❌ MEMORY ERROR: Inconsistent sizes: {set(memory_usage[5:])}")
-        return False
-
-
-def run_all_tests():
-    """Run complete test suite"""
-    print("\n")
-    print("╔" + "=" * 68 + "╗")
-    print("║" + " " * 10 + "🔗 GLUED INTERACTIONS - Complete Test Suite" + " " * 14 + "║")
-    print("╚" + "=" * 68 + "╝")
-    
-    results = {
-        "FIFO Queue": test_fifo_behavior(),
-        "Context Injection": test_context_injection(),
-        "Multi-Turn Dialogue": test_multi_turn_dialogue(),
-        "Database Persistence": test_database_persistence(),
-        "Memory Management": test_no_memory_leaks(),
-    }
-    
-    # Summary
-    print_header("📊 TEST SUMMARY")
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
-    for test_name, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status:8s} | {test_name}")
-    
-    print("\n" + "-" * 70)
-    print(f"Score: {passed}/{total} tests passed ({passed*100//total}%)")
-    
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED! GLUED INTERACTIONS WORKING PERFECTLY")
-    else:
-        print(f"\n⚠️  {total - passed} test(s) failed. Check output above.")
-    
-    print("=" * 70 + "\n")
-    return passed == total
+    out.flush()
+    assert passed, f"DATABASE ERROR: Expected 3 rows in WAL mode, got {len(rows)} ({journal_mode})"
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-xvs"]))